@@ -40,11 +40,24 @@ class Settings:
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
     FISH_API_KEY: str = os.getenv("FISH_API_KEY", "")
     XAI_API_KEY: str = os.getenv("XAI_API_KEY", "")
-    INTRO_MUSIC_PATH: Path = Path(__file__).parent / "static" / "intro_storyja.mp3"
-    OUTRO_MUSIC_PATH: Path = Path(__file__).parent / "static" / "outro_storyja.mp3"
+    STATIC_DIR: Path = Path(__file__).parent / "static"
+    INTRO_MUSIC_PATH: Path = STATIC_DIR / "intro_storyja.mp3"
+    OUTRO_MUSIC_PATH: Path = STATIC_DIR / "outro_storyja.mp3"
     FAL_KEY: str = os.getenv("FAL_KEY", "")
     DEEPSEEK_API_KEY: str = os.getenv("DEEPSEEK_API_KEY", "")
 
+    # Story generation: write chapters concurrently from the outline handoffs
+    PARALLEL_CHAPTERS: bool = os.getenv("PARALLEL_CHAPTERS", "false").lower() == "true"
+    GEMINI_CONCURRENCY: int = int(os.getenv("GEMINI_CONCURRENCY", "4"))
+    # Max characters of previous chapters handed to the next one (0 = the whole story so far)
+    STORY_CONTEXT_CHARS: int = int(os.getenv("STORY_CONTEXT_CHARS", "0"))
+    # On-disk cache for (near-)deterministic LLM responses
+    LLM_CACHE_MAX_MB: int = int(os.getenv("LLM_CACHE_MAX_MB", "50"))
+    # Parallel TTS jobs per story (Fish additionally caps itself at 2 concurrent calls)
+    TTS_CONCURRENCY: int = int(os.getenv("TTS_CONCURRENCY", "2"))
+    # On-disk cache of synthesized TTS chunks
+    TTS_CACHE_MAX_MB: int = int(os.getenv("TTS_CACHE_MAX_MB", "500"))
+
     # SMTP Settings (Gmail)
     SMTP_HOST: str = os.getenv("SMTP_HOST", "smtp.gmail.com")
     SMTP_PORT: int = int(os.getenv("SMTP_PORT", "587"))
@@ -1,5 +1,6 @@
 import os
 from pathlib import Path
+from sqlalchemy import event
 from sqlmodel import SQLModel, create_engine, Session
 from app.config import settings
 
@@ -11,6 +12,18 @@ sqlite_url = f"sqlite:///{settings.AUDIO_OUTPUT_DIR}/{sqlite_file_name}"
 connect_args = {"check_same_thread": False}
 engine = create_engine(sqlite_url, echo=False, connect_args=connect_args)
 
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """WAL lets readers run alongside the pipeline's progress writes instead of blocking on them."""
+    cur = dbapi_connection.cursor()
+    cur.execute("PRAGMA journal_mode=WAL")
+    # Safe under WAL: a power loss can drop the last commits but never corrupts the DB
+    cur.execute("PRAGMA synchronous=NORMAL")
+    cur.execute("PRAGMA mmap_size=268435456")
+    cur.execute("PRAGMA busy_timeout=5000")
+    cur.close()
+
 def create_db_and_tables():
     SQLModel.metadata.create_all(engine)
     ensure_migrations()
@@ -56,6 +69,15 @@ def ensure_migrations():
             cur.execute(f"ALTER TABLE storymeta ADD COLUMN updated_at DATETIME DEFAULT '{now_iso}'")
             conn.commit()
 
+        # get_all orders by created_at; an index lets SQLite read rows pre-sorted
+        cur.execute("CREATE INDEX IF NOT EXISTS ix_storymeta_created_at ON storymeta (created_at)")
+        # The podcast feed only wants Spotify stories; a partial index keeps that scan to the subset
+        cur.execute(
+            "CREATE INDEX IF NOT EXISTS ix_storymeta_spotify_created_at "
+            "ON storymeta (created_at) WHERE is_on_spotify = 1"
+        )
+        conn.commit()
+
         # Check if columns exist in user table
         cur.execute("PRAGMA table_info(user)")
         user_columns = [row[1] for row in cur.fetchall()]
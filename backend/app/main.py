@@ -9,16 +9,19 @@ Endpoints:
   GET  /api/voices               – List available voice profiles
   GET  /api/voices/{key}/preview – Preview a voice
   GET  /api/feed.xml             – Podcast RSS feed
-  GET  /api/status/{id}          – Generation status (SSE)
+  GET  /api/status/{id}          – Generation status (polling)
+  GET  /api/status/{id}/events   – Generation status (SSE)
 """
 
 # Deploy Trigger: Live Feed Generation v1.2.1
 import asyncio
-import json
+import orjson
 import logging
-import time
+import logging.handlers
+import queue
 import uuid
 import httpx
+from collections import OrderedDict
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -37,22 +40,18 @@ if settings.GEMINI_API_KEY:
 else:
     logging.warning("GEMINI_API_KEY NOT detected in environment!")
 
-class LogFileHandler(logging.Handler):
-    def emit(self, record):
-        try:
-            with open(DEBUG_LOG_PATH, "a", encoding="utf-8") as f:
-                f.write(self.format(record) + "\n")
-        except:
-            pass
-
-log_handler = LogFileHandler()
-log_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
-logging.getLogger().addHandler(log_handler)
+# Records are queued on the event loop and written by a background thread
+# that keeps debug.log open, so logging never blocks request handlers.
+_log_queue: queue.Queue = queue.Queue(-1)
+_file_handler = logging.FileHandler(DEBUG_LOG_PATH, encoding="utf-8", delay=True)
+_file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+log_listener = logging.handlers.QueueListener(_log_queue, _file_handler)
+logging.getLogger().addHandler(logging.handlers.QueueHandler(_log_queue))
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, StreamingResponse, Response
+from fastapi.responses import FileResponse, StreamingResponse, Response, ORJSONResponse
 from pydantic import BaseModel
 
 
@@ -62,7 +61,6 @@ from app.models import (
     HookRequest,
     HookResponse,
     StoryMeta,
-    StoryMetaResponse,
     StoryListResponse,
     VoiceProfile,
     KindleExportRequest,
@@ -79,31 +77,23 @@ from app.auth_utils import get_current_active_user, get_optional_user
 from fastapi import Depends
 from app.database import create_db_and_tables
 from app.models import StoryUpdate
-from app.services.story_generator import (
-    generate_full_story, 
-    generate_story_hook, 
-    get_author_names,
-    generate_post_story_analysis
-)
-from app.services.tts_service import (
-    chapters_to_audio,
-    get_available_voices,
-    generate_voice_preview,
-    generate_tts_chunk,
-)
-from app.services.audio_processor import merge_audio_files, get_audio_duration
-from app.services.rss_generator import generate_rss_feed
-from app.services.image_generator import generate_story_image
-from app.services.kindle_service import generate_epub, send_to_kindle
+# Heavy service modules (LLM/TTS/image/EPUB clients) are imported at their usage
+# sites so that light endpoints do not pay for them at cold start.
 from fastapi import Form
+from fastapi import Path as PathParam
+from typing import Annotated
 from app.services.whatsapp_service import whatsapp_service
-from app.services.conversation_service import conversation_service
+
+# Story ids are the first 8 hex digits of a uuid4; anything else is rejected by the router
+STORY_ID_PATTERN = r"^[0-9a-f]{8}$"
+StoryId = Annotated[str, PathParam(pattern=STORY_ID_PATTERN)]
 
 
-app = FastAPI(title="Bedtime Stories API", version="1.0.0")
+app = FastAPI(title="Bedtime Stories API", version="1.0.0", default_response_class=ORJSONResponse)
 
 @app.on_event("startup")
 def on_startup():
+    log_listener.start()
     create_db_and_tables()
     
     # Manual migration for SQLite (adding missing columns)
@@ -161,10 +151,21 @@ def on_startup():
         logger.error(f"Migration error: {e}")
     logger.info("Bedtime Stories API starting up - Running database initialization...")
 
+@app.on_event("shutdown")
+async def on_shutdown():
+    from app.services.tts_service import close_http_client
+    from app.services.rate_limiter import rate_limiter
+    await close_http_client()
+    rate_limiter.flush()
+    log_listener.stop()
+
+# Auth uses Bearer tokens, not cookies: without credentials the wildcard origin is
+# valid and CORSMiddleware sends a static header instead of echoing each Origin.
+# Only pure ASGI middleware here – no @app.middleware("http") / BaseHTTPMiddleware.
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
-    allow_credentials=True,
+    allow_credentials=False,
     allow_methods=["*"],
     allow_headers=["*"],
 )
@@ -178,7 +179,8 @@ app.include_router(pro.router)
 
 
 # Mount Static Files (for Legal Docs / Images)
-STATIC_DIR = Path(__file__).parent / "static"
+STATIC_DIR = settings.STATIC_DIR
+PODCAST_COVER_PATH = STATIC_DIR / "podcast-cover.png"
 app.mount("/api/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
 
 from app.services.store import store
@@ -223,11 +225,11 @@ async def run_whatsapp_pipeline(from_number: str, **kwargs):
         )
         
         logger.info(f"WhatsApp Pipeline: Sending single combined notification for {story_id} to {from_number}")
-        whatsapp_service.send_message(from_number, combined_text, media_url=media_url)
+        await whatsapp_service.send_message(from_number, combined_text, media_url=media_url)
         
     except Exception as e:
         logger.error(f"WhatsApp Pipeline failed for story {story_id}: {e}", exc_info=True)
-        whatsapp_service.send_message(from_number, "❌ Leider gab es ein Problem bei der Erstellung deiner Geschichte. Bitte versuche es später noch einmal.")
+        await whatsapp_service.send_message(from_number, "❌ Leider gab es ein Problem bei der Erstellung deiner Geschichte. Bitte versuche es später noch einmal.")
 
 async def download_whatsapp_media(media_id: str):
     """Download media from WhatsApp Cloud API."""
@@ -315,6 +317,7 @@ async def handle_incoming_whatsapp(message: dict):
         logger.info(f"WhatsApp Webhook: Processing message from {from_number} - Body: '{body}' - Media: {len(media_items)}")
 
         # 2. Process message via Conversation Service
+        from app.services.conversation_service import conversation_service
         try:
             result = await conversation_service.process_message(from_number, body, media_items=media_items)
             logger.info(f"WhatsApp Webhook: AI Result Status={result.get('status')} - Reply: '{result.get('reply')[:50]}...'")
@@ -330,9 +333,9 @@ async def handle_incoming_whatsapp(message: dict):
             if len(starter_msg) > 100:
                 starter_msg = "Alles klar, ich schreibe die Geschichte jetzt für dich! Das dauert einen kurzen Moment... ✍️"
             
-            whatsapp_service.send_message(from_number, starter_msg)
+            await whatsapp_service.send_message(from_number, starter_msg)
             
-            story_id = str(uuid.uuid4())[:8]
+            story_id = uuid.uuid4().hex[:8]
             wa_user = store.get_or_create_whatsapp_user(from_number)
             
             story_service.initialize_story(
@@ -363,11 +366,11 @@ async def handle_incoming_whatsapp(message: dict):
             # Standard planning message
             reply_text = result.get("reply", "Ich höre...")
             suggestions = result.get("suggestions", [])
-            whatsapp_service.send_message(from_number, reply_text, buttons=suggestions if suggestions else None)
+            await whatsapp_service.send_message(from_number, reply_text, buttons=suggestions if suggestions else None)
 
     except Exception as e:
         logger.error(f"Critical error in handle_incoming_whatsapp: {e}", exc_info=True)
-        whatsapp_service.send_message(from_number, "❌ Da ist etwas schief gelaufen. Bitte versuch es später nochmal.")
+        await whatsapp_service.send_message(from_number, "❌ Da ist etwas schief gelaufen. Bitte versuch es später nochmal.")
 
 @app.post("/api/webhook/whatsapp")
 async def whatsapp_webhook(request: Request):
@@ -409,17 +412,48 @@ async def whatsapp_webhook(request: Request):
 # Voices
 # ──────────────────────────────────
 
+# VoiceProfile defaults the raw voice dicts don't carry
+_VOICE_DEFAULTS = {"description": None, "accent": "DE", "style": "Standard"}
+
+
 @app.get("/api/voices", response_model=list[VoiceProfile])
 async def list_voices(current_user: User | None = Depends(get_optional_user)):
     """List all available voice profiles."""
-    return get_available_voices(user_id=current_user.id if current_user else None)
+    from app.services.tts_service import get_available_voices
+    # Two DB queries; keep them off the event loop
+    voices = await asyncio.to_thread(get_available_voices, current_user.id if current_user else None)
+    # Plain dicts we built ourselves: skip the response_model validation round-trip
+    return ORJSONResponse([{**_VOICE_DEFAULTS, **v} for v in voices])
+
+
+# Small, rarely changing preview MP3s kept in memory: voice_key -> (etag, bytes)
+_PREVIEW_CACHE_SIZE = 32
+_preview_cache: OrderedDict[str, tuple[str, bytes]] = OrderedDict()
+
+
+def _invalidate_preview(voice_key: str):
+    """Drop a cached preview after its voice was edited."""
+    _preview_cache.pop(voice_key, None)
+
+
+def _preview_response(request: Request, etag: str, data: bytes) -> Response:
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=3600"}
+    if request.headers.get("If-None-Match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=data, media_type="audio/mpeg", headers=headers)
 
 
 @app.get("/api/voices/{voice_key}/preview")
-async def preview_voice(voice_key: str):
+async def preview_voice(voice_key: str, request: Request):
     """Generate and return a voice preview clip."""
+    cached = _preview_cache.get(voice_key)
+    if cached:
+        _preview_cache.move_to_end(voice_key)
+        return _preview_response(request, *cached)
+
+    from app.services.tts_service import generate_voice_preview
     preview_dir = settings.AUDIO_OUTPUT_DIR / "previews"
-    preview_dir.mkdir(parents=True, exist_ok=True)
+    await asyncio.to_thread(preview_dir.mkdir, parents=True, exist_ok=True)
     preview_path = preview_dir / f"{voice_key}.mp3"
     
     try:
@@ -429,8 +463,45 @@ async def preview_voice(voice_key: str):
         # Return fallback if exists, or error
         if not preview_path.exists():
             raise HTTPException(status_code=500, detail=str(e))
-            
-    return FileResponse(preview_path, media_type="audio/mpeg")
+        # Serve the stale fallback, but don't pin it in memory
+        return FileResponse(preview_path, media_type="audio/mpeg")
+
+    import hashlib
+    data = await asyncio.to_thread(preview_path.read_bytes)
+    etag = f'"{hashlib.md5(data).hexdigest()}"'
+    _preview_cache[voice_key] = (etag, data)
+    while len(_preview_cache) > _PREVIEW_CACHE_SIZE:
+        _preview_cache.popitem(last=False)
+    return _preview_response(request, etag, data)
+
+
+@app.on_event("startup")
+async def warm_voice_previews():
+    """Render missing voice previews in the background so the first click doesn't wait on TTS."""
+    from app.services.tts_service import get_available_voices, generate_voice_preview
+    preview_dir = settings.AUDIO_OUTPUT_DIR / "previews"
+
+    async def _warm():
+        try:
+            await asyncio.to_thread(preview_dir.mkdir, parents=True, exist_ok=True)
+            voices = await asyncio.to_thread(get_available_voices)
+            missing = [v["key"] for v in voices if not (preview_dir / f"{v['key']}.mp3").exists()]
+            if not missing:
+                return
+            logger.info(f"Warming {len(missing)} voice previews")
+            sem = asyncio.Semaphore(2)
+
+            async def _one(key: str):
+                async with sem:
+                    await generate_voice_preview(key, preview_dir / f"{key}.mp3")
+
+            results = await asyncio.gather(*(_one(k) for k in missing), return_exceptions=True)
+            for key, res in zip(missing, results):
+                if isinstance(res, Exception):
+                    logger.warning(f"Preview warm-up failed for {key}: {res}")
+        except Exception as e:
+            logger.warning(f"Preview warm-up failed: {e}")
+    asyncio.create_task(_warm())
 
 
 # ──────────────────────────────────
@@ -440,7 +511,7 @@ async def preview_voice(voice_key: str):
 @app.post("/api/stories/generate")
 async def start_generation(req: StoryRequest, current_user: User = Depends(get_current_active_user)):
     """Start async story generation. Returns story ID to poll status."""
-    story_id = str(uuid.uuid4())[:8]
+    story_id = uuid.uuid4().hex[:8]
 
     # Fetch parent story context if it's a remix/sequel
     parent_meta = None
@@ -451,7 +522,7 @@ async def start_generation(req: StoryRequest, current_user: User = Depends(get_c
             text_path = settings.AUDIO_OUTPUT_DIR / req.parent_id / "story.json"
             if text_path.exists():
                 try:
-                    parent_text = json.loads(text_path.read_text(encoding="utf-8"))
+                    parent_text = orjson.loads(await asyncio.to_thread(text_path.read_bytes))
                 except:
                     logger.warning(f"Failed to load parent text for {req.parent_id}")
 
@@ -507,7 +578,7 @@ class RevoiceRequest(BaseModel):
 
 @app.post("/api/stories/{story_id}/revoice")
 async def start_revoice(
-    story_id: str, 
+    story_id: StoryId, 
     req: RevoiceRequest,
     current_user: User = Depends(get_current_active_user)
 ):
@@ -541,7 +612,7 @@ async def start_revoice(
 
 @app.post("/api/stories/{story_id}/analyze-speakers")
 async def analyze_story_speakers(
-    story_id: str,
+    story_id: StoryId,
     force: bool = False,
     current_user: User = Depends(get_current_active_user)
 ):
@@ -559,7 +630,7 @@ async def analyze_story_speakers(
         raise HTTPException(status_code=404, detail="Story text file missing")
 
     try:
-        story_data = json.loads(text_path.read_text(encoding="utf-8"))
+        story_data = orjson.loads(await asyncio.to_thread(text_path.read_bytes))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to read story JSON: {e}")
 
@@ -570,7 +641,7 @@ async def analyze_story_speakers(
         for c in story_data.get("chapters", []):
             if "text" in c:
                 c["text"] = re.sub(r'<\|speaker:\d+\|>(?:\s*\[\w+\])?', '', c["text"])
-        text_path.write_text(json.dumps(story_data, ensure_ascii=False, indent=2), encoding="utf-8")
+        await asyncio.to_thread(text_path.write_bytes, orjson.dumps(story_data))
 
     # 1. Check if the story already has speaker tags
     has_speaker_tags = any("<|speaker:" in c.get("text", "") for c in story_data.get("chapters", []))
@@ -579,7 +650,7 @@ async def analyze_story_speakers(
         # Inject speaker tags retroactively
         from app.services.story_generator import inject_speaker_tags_to_story
         story_data = await inject_speaker_tags_to_story(story_data, supports_emotions=True)
-        text_path.write_text(json.dumps(story_data, ensure_ascii=False, indent=2), encoding="utf-8")
+        await asyncio.to_thread(text_path.write_bytes, orjson.dumps(story_data))
 
         # Also update story meta to reflect multi_voice
         meta.multi_voice = True
@@ -599,7 +670,7 @@ class RegenerateImageRequest(BaseModel):
 @app.post("/api/stories/generate-free")
 async def start_free_generation(req: FreeTextRequest, current_user: User = Depends(get_current_active_user)):
     """Start generation from free text prompt."""
-    story_id = str(uuid.uuid4())[:8]
+    story_id = uuid.uuid4().hex[:8]
 
     # Initialize story record synchronously
     story_service.initialize_story(
@@ -636,6 +707,7 @@ async def start_free_generation(req: FreeTextRequest, current_user: User = Depen
 @app.post("/api/generate-hook", response_model=HookResponse)
 async def api_generate_hook(req: HookRequest):
     """Generate a quick surreal story idea hook based on genre and author."""
+    from app.services.story_generator import generate_story_hook
     hook = await generate_story_hook(req.genre, req.author_id, user_input=req.user_input)
     return HookResponse(hook_text=hook)
 
@@ -644,7 +716,7 @@ async def api_generate_hook(req: HookRequest):
 # ──────────────────────────────────
 
 @app.get("/api/status/{story_id}")
-async def get_status(story_id: str):
+async def get_status(story_id: StoryId):
     """Get current generation status."""
     status = story_service.get_status(story_id)
     if not status:
@@ -655,6 +727,68 @@ async def get_status(story_id: str):
     }
 
 
+SSE_KEEPALIVE_SECONDS = 15
+# Store polling interval for stories generating in another process
+SSE_POLL_SECONDS = 1.0
+
+
+@app.get("/api/status/{story_id}/events")
+async def stream_status(story_id: StoryId):
+    """Stream generation status as Server-Sent Events until done/error."""
+    status = story_service.get_status(story_id)
+    if not status:
+        raise HTTPException(status_code=404, detail="Story not found")
+
+    def _event(data: dict) -> str:
+        return f"data: {orjson.dumps({'id': story_id, **data}).decode()}\n\n"
+
+    async def event_stream():
+        q = story_service.subscribe(story_id)
+        try:
+            current = story_service.get_status(story_id) or status
+            yield _event(current)
+            if current.get("status") in ("done", "error"):
+                return
+            if q is None:
+                # Pipeline runs elsewhere (other worker / before a restart): follow the store row
+                idle = 0.0
+                while True:
+                    await asyncio.sleep(SSE_POLL_SECONDS)
+                    latest = await asyncio.to_thread(story_service.get_status, story_id)
+                    if latest is None:
+                        return
+                    if latest != current:
+                        current = latest
+                        idle = 0.0
+                        yield _event(current)
+                        if current.get("status") in ("done", "error"):
+                            return
+                    else:
+                        idle += SSE_POLL_SECONDS
+                        if idle >= SSE_KEEPALIVE_SECONDS:
+                            idle = 0.0
+                            yield ": keepalive\n\n"
+            while True:
+                try:
+                    item = await asyncio.wait_for(q.get(), timeout=SSE_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    # Comment line keeps proxies from closing an idle stream
+                    yield ": keepalive\n\n"
+                    continue
+                yield _event(item)
+                if item.get("status") in ("done", "error"):
+                    return
+        finally:
+            if q is not None:
+                story_service.unsubscribe(story_id, q)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 # ──────────────────────────────────
 # Stories CRUD
 # ──────────────────────────────────
@@ -727,9 +861,7 @@ async def list_stories(
             stories_to_list = [s for s in stories_to_list_base if s.genre in genre_set]
         else:
             stories_to_list = stories_to_list_base
-            
-        # Sort by creation date (newest first)
-        stories_to_list.sort(key=lambda x: x.created_at, reverse=True)
+        # Already newest-first: store.get_all() orders by created_at and the filters above keep that order
 
         # Attach display names (username or email) for author display
         for s in stories_to_list:
@@ -738,12 +870,9 @@ async def list_stories(
             else:
                 s.user_email = "System"
         
-        # POPULATE IS_FAVORITE for the current user
-        stories_to_list = [StoryMetaResponse.model_validate(s) for s in stories_to_list]
+        # POPULATE IS_FAVORITE for the current user (items are already StoryMetaResponse copies)
         if current_user:
-            story_ids = [s.id for s in stories_to_list]
-            fav_results = store.get_all(requesting_user_id=current_user.id)
-            fav_ids = {f.id for f in fav_results if f.is_favorite}
+            fav_ids = store.get_favorite_ids(current_user.id)
             for s in stories_to_list:
                 s.is_favorite = s.id in fav_ids
 
@@ -754,13 +883,15 @@ async def list_stories(
         end = start + page_size
         paginated_stories = stories_to_list[start:end]
             
-        return StoryListResponse(
+        result = StoryListResponse(
             stories=paginated_stories, 
             total=total,
             total_my=total_my,
             total_public=total_public,
             available_genres=available_genres
         )
+        # Serialize once in pydantic-core instead of letting FastAPI re-validate the model
+        return Response(content=result.model_dump_json(), media_type="application/json")
     except HTTPException:
         raise
     except Exception as e:
@@ -878,6 +1009,7 @@ async def admin_update_voice(
             session.refresh(voice)
             
             # Delete cached preview to force regeneration
+            _invalidate_preview(voice_id)
             preview_path = settings.AUDIO_OUTPUT_DIR / "previews" / f"{voice_id}.mp3"
             try:
                 preview_path.unlink(missing_ok=True)
@@ -907,6 +1039,7 @@ async def admin_update_voice(
             session.refresh(voice)
             
             # Delete cached preview to force regeneration
+            _invalidate_preview(voice_id)
             preview_path = settings.AUDIO_OUTPUT_DIR / "previews" / f"{voice_id}.mp3"
             try:
                 preview_path.unlink(missing_ok=True)
@@ -945,7 +1078,6 @@ async def admin_add_voice(
         
     # Check if voice already exists
     from app.database import get_session
-    from sqlmodel import select
     with next(get_session()) as session:
         existing = session.get(SystemVoice, slug)
         if existing:
@@ -983,7 +1115,6 @@ async def admin_delete_user(user_id: str, current_user: User = Depends(get_curre
         raise HTTPException(status_code=403, detail="Nur Admins dürfen Benutzer löschen.")
     
     from app.database import get_session
-    from sqlmodel import select
     
     with next(get_session()) as session:
         user = session.get(User, user_id)
@@ -1031,7 +1162,7 @@ async def admin_update_user(
 
 
 @app.delete("/api/admin/stories/{story_id}")
-async def admin_delete_story(story_id: str, current_user: User = Depends(get_current_active_user)):
+async def admin_delete_story(story_id: StoryId, current_user: User = Depends(get_current_active_user)):
     """Delete a story (Admin only)."""
     if not current_user.is_admin:
         raise HTTPException(status_code=403, detail="Nur Admins dürfen Geschichten löschen.")
@@ -1044,13 +1175,13 @@ async def admin_delete_story(story_id: str, current_user: User = Depends(get_cur
     story_dir = settings.AUDIO_OUTPUT_DIR / story_id
     if story_dir.exists():
         import shutil
-        shutil.rmtree(story_dir)
+        await asyncio.to_thread(shutil.rmtree, story_dir)
         
     return {"status": "success", "message": "Geschichte gelöscht."}
 
 
 @app.post("/api/admin/analyze-story/{story_id}")
-async def admin_analyze_story(story_id: str, current_user: User = Depends(get_current_active_user)):
+async def admin_analyze_story(story_id: StoryId, current_user: User = Depends(get_current_active_user)):
     """Analyze an existing story to refine synopsis and extract highlights (Admin only)."""
     if not current_user.is_admin:
         raise HTTPException(status_code=403, detail="Nur Admins dürfen Geschichten analysieren.")
@@ -1064,7 +1195,8 @@ async def admin_analyze_story(story_id: str, current_user: User = Depends(get_cu
         raise HTTPException(status_code=400, detail="Kein Text für diese Geschichte verfügbar.")
     
     try:
-        story_data = json.loads(text_path.read_text(encoding="utf-8"))
+        from app.services.story_generator import generate_post_story_analysis
+        story_data = orjson.loads(await asyncio.to_thread(text_path.read_bytes))
         analysis = await generate_post_story_analysis(meta.title, story_data.get("chapters", []))
         
         return {
@@ -1107,9 +1239,36 @@ async def admin_update_setting(
     return updated
 
 
+# Parsed story.json chapters, keyed by story_id and validated by mtime
+_CHAPTERS_CACHE_SIZE = 128
+_chapters_cache: OrderedDict[str, tuple[int, list]] = OrderedDict()
+
+
+async def _load_chapters(story_id: str, text_path: Path) -> list | None:
+    """Return the chapters of story.json, re-parsing only when the file changed."""
+    try:
+        st = await asyncio.to_thread(text_path.stat)
+    except FileNotFoundError:
+        _chapters_cache.pop(story_id, None)
+        return None
+
+    entry = _chapters_cache.get(story_id)
+    if entry and entry[0] == st.st_mtime_ns:
+        _chapters_cache.move_to_end(story_id)
+        return entry[1]
+
+    raw = await asyncio.to_thread(text_path.read_bytes)
+    chapters = orjson.loads(raw).get("chapters", [])
+    _chapters_cache[story_id] = (st.st_mtime_ns, chapters)
+    _chapters_cache.move_to_end(story_id)
+    while len(_chapters_cache) > _CHAPTERS_CACHE_SIZE:
+        _chapters_cache.popitem(last=False)
+    return chapters
+
+
 @app.get("/api/stories/{story_id}")
 async def get_story(
-    story_id: str,
+    story_id: StoryId,
     current_user: User | None = Depends(get_optional_user)
 ):
     """Get full details of a single story."""
@@ -1128,18 +1287,16 @@ async def get_story(
     # No additional check needed here as ID possession is the access token.
 
     text_path = settings.AUDIO_OUTPUT_DIR / story_id / "story.json"
-    if not text_path.exists():
-        # Fallback for stories without detail JSON
-        return {**story.model_dump(), "chapters": []}
-        
     try:
-        data = json.loads(text_path.read_text(encoding="utf-8"))
-        chapters = data.get("chapters", [])
+        chapters = await _load_chapters(story_id, text_path)
+        if chapters is None:
+            # Fallback for stories without detail JSON
+            return ORJSONResponse({**story.model_dump(), "chapters": []})
         
         # On-demand metadata fix for existing stories
         needs_save = False
         if story.word_count is None or story.word_count == 0:
-            story.word_count = len("\n".join([c.get("text", "") for c in chapters]).split())
+            story.word_count = sum(len(c.get("text", "").split()) for c in chapters)
             needs_save = True
         if story.chapter_count is None or story.chapter_count == 0:
             story.chapter_count = len(chapters)
@@ -1157,15 +1314,16 @@ async def get_story(
             logger.info(f"Fixed metadata on-demand for story {story_id}")
             store.add_story(story)
 
-        return {**story.model_dump(), "chapters": chapters}
+        # Returned as a response directly so FastAPI skips jsonable_encoder over every chapter
+        return ORJSONResponse({**story.model_dump(), "chapters": chapters})
     except Exception as e:
         logger.error(f"Failed to read story details for {story_id}: {e}")
-        return {**story.model_dump(), "chapters": []}
+        return ORJSONResponse({**story.model_dump(), "chapters": []})
 
 
 @app.post("/api/stories/{story_id}/favorite")
 async def toggle_favorite(
-    story_id: str,
+    story_id: StoryId,
     current_user: User = Depends(get_current_active_user)
 ):
     """Toggle a story as favorite for the current user."""
@@ -1181,32 +1339,56 @@ async def list_favorites(
     return store.get_favorites(current_user.id)
 
 
+AUDIO_CHUNK_SIZE = 256 * 1024
+
+
 @app.get("/api/stories/{story_id}/audio")
-async def get_audio(story_id: str, request: Request):
+async def get_audio(story_id: StoryId, request: Request):
     """Stream the final MP3 audio file with Range support for seeking."""
     audio_path = settings.AUDIO_OUTPUT_DIR / story_id / "story.mp3"
-    if not audio_path.exists():
+    try:
+        st = await asyncio.to_thread(audio_path.stat)
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Audio not found")
 
     meta = store.get_by_id(story_id)
     filename = f"{meta.title if meta else story_id}.mp3"
     
-    file_size = audio_path.stat().st_size
+    file_size = st.st_size
+    # Audio can be replaced by a revoice under the same URL, so clients revalidate via ETag
+    etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+    headers = {
+        "ETag": etag,
+        "Accept-Ranges": "bytes",
+        "Cache-Control": "no-cache",
+    }
+    if request.headers.get("If-None-Match") == etag:
+        return Response(status_code=304, headers=headers)
+
     range_header = request.headers.get("Range", None)
     
     if range_header:
-        byte1, byte2 = 0, None
-        match = range_header.replace("bytes=", "").split("-")
-        if match[0]:
-            byte1 = int(match[0])
-        if len(match) > 1 and match[1]:
-            byte2 = int(match[1])
-
-        length = file_size - byte1
-        if byte2 is not None:
-            length = byte2 + 1 - byte1
-
-        def stream_file_range(start, length_to_read, chunk_size=8192):
+        # Single byte range only (what audio players send): "a-b", "a-" or the suffix form "-n"
+        try:
+            first, _, last = range_header.strip().removeprefix("bytes=").split(",")[0].partition("-")
+            if first:
+                byte1 = int(first)
+                byte2 = min(int(last), file_size - 1) if last else file_size - 1
+            else:
+                byte1 = max(0, file_size - int(last))
+                byte2 = file_size - 1
+        except ValueError:
+            byte1, byte2 = file_size, -1
+        if byte1 > byte2 or byte1 >= file_size:
+            raise HTTPException(
+                status_code=416,
+                detail="Requested range not satisfiable",
+                headers={"Content-Range": f"bytes */{file_size}"},
+            )
+        length = byte2 + 1 - byte1
+
+        # Each chunk of a sync iterator is one threadpool hop, so read in large blocks
+        def stream_file_range(start, length_to_read, chunk_size=AUDIO_CHUNK_SIZE):
             with open(audio_path, "rb") as f:
                 f.seek(start)
                 remaining = length_to_read
@@ -1218,24 +1400,24 @@ async def get_audio(story_id: str, request: Request):
                     yield data
                     remaining -= len(data)
 
-        response = StreamingResponse(stream_file_range(byte1, length), status_code=206, media_type="audio/mpeg")
+        response = StreamingResponse(stream_file_range(byte1, length), status_code=206, media_type="audio/mpeg", headers=headers)
         response.headers["Content-Range"] = f"bytes {byte1}-{byte1 + length - 1}/{file_size}"
-        response.headers["Accept-Ranges"] = "bytes"
         response.headers["Content-Length"] = str(length)
         return response
     
-    response = FileResponse(
+    # Pass the stat we already have so FileResponse does not stat the file again
+    return FileResponse(
         audio_path,
         media_type="audio/mpeg",
         filename=filename,
+        stat_result=st,
+        headers=headers,
     )
-    response.headers["Accept-Ranges"] = "bytes"
-    return response
 
 
 @app.patch("/api/stories/{story_id}")
 async def update_story(
-    story_id: str, 
+    story_id: StoryId, 
     req: StoryUpdate,
     current_user: User = Depends(get_current_active_user)
 ):
@@ -1281,7 +1463,7 @@ async def update_story(
             story_data = {"title": meta.title, "chapters": req.chapters}
         else:
             try:
-                story_data = json.loads(text_path.read_text(encoding="utf-8"))
+                story_data = orjson.loads(await asyncio.to_thread(text_path.read_bytes))
                 story_data["chapters"] = req.chapters
                 if req.title:
                     story_data["title"] = req.title
@@ -1294,8 +1476,8 @@ async def update_story(
         meta.multi_voice = False
         
         # Save updated text
-        story_dir.mkdir(parents=True, exist_ok=True)
-        text_path.write_text(json.dumps(story_data, ensure_ascii=False, indent=2), encoding="utf-8")
+        await asyncio.to_thread(story_dir.mkdir, parents=True, exist_ok=True)
+        await asyncio.to_thread(text_path.write_bytes, orjson.dumps(story_data))
         
         # Invalidate audio: Delete MP3 and chunks
         audio_path = story_dir / "story.mp3"
@@ -1315,8 +1497,7 @@ async def update_story(
                 logger.error(f"Failed to delete chunks directory: {e}")
             
         # Update metadata stats
-        total_text = "\n".join([c.get("text", "") for c in req.chapters])
-        meta.word_count = len(total_text.split())
+        meta.word_count = sum(len(c.get("text", "").split()) for c in req.chapters)
         meta.chapter_count = len(req.chapters)
         meta.duration_seconds = 0
         meta.updated_at = datetime.now(timezone.utc)
@@ -1327,7 +1508,7 @@ async def update_story(
 
 @app.delete("/api/stories/{story_id}")
 async def delete_story(
-    story_id: str,
+    story_id: StoryId,
     current_user: User = Depends(get_current_active_user)
 ):
     """Delete a story and its files (Owner or Admin only)."""
@@ -1344,14 +1525,14 @@ async def delete_story(
     import shutil
     story_dir = settings.AUDIO_OUTPUT_DIR / story_id
     if story_dir.exists():
-        shutil.rmtree(story_dir)
+        await asyncio.to_thread(shutil.rmtree, story_dir)
 
     return {"status": "deleted"}
 
 
 @app.post("/api/stories/{story_id}/regenerate-image")
 async def regenerate_story_image_api(
-    story_id: str,
+    story_id: StoryId,
     req: RegenerateImageRequest | None = None,
     current_user: User = Depends(get_current_active_user)
 ):
@@ -1370,13 +1551,14 @@ async def regenerate_story_image_api(
         raise HTTPException(status_code=404, detail="Story text data (story.json) missing")
 
     try:
-        story_data = json.loads(text_path.read_text(encoding="utf-8"))
+        story_data = orjson.loads(await asyncio.to_thread(text_path.read_bytes))
         synopsis = story_data.get("synopsis", "")
 
         async def background_task():
             image_path = story_dir / "cover.png"
             logger.info(f"MANUAL REGEN: Calling generate_story_image for {story_id}")
             
+            from app.services.image_generator import generate_story_image
             hints = req.image_hints if req else None
             res = await generate_story_image(synopsis, image_path, genre=meta.genre, style=meta.style, image_hints=hints)
             if res:
@@ -1401,22 +1583,55 @@ async def regenerate_story_image_api(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Covers can be regenerated under the same URL, so story art is revalidated every time
+IMAGE_CACHE_CONTROL = "no-cache"
+# The podcast cover is referenced with a ?v=<mtime> cache-buster from the feed
+PODCAST_COVER_CACHE_CONTROL = "public, max-age=86400"
+
+
+async def _cached_file(request: Request, path: Path, media_type: str, cache_control: str = IMAGE_CACHE_CONTROL) -> Response:
+    """FileResponse with an mtime/size ETag that answers conditional requests with 304."""
+    try:
+        st = await asyncio.to_thread(path.stat)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Image not found")
+
+    from email.utils import formatdate, parsedate_to_datetime
+    etag = f'W/"{st.st_mtime_ns:x}-{st.st_size:x}"'
+    headers = {
+        "ETag": etag,
+        "Last-Modified": formatdate(st.st_mtime, usegmt=True),
+        "Cache-Control": cache_control,
+    }
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match is not None:
+        if if_none_match == etag:
+            return Response(status_code=304, headers=headers)
+    elif "If-Modified-Since" in request.headers:
+        try:
+            if int(st.st_mtime) <= parsedate_to_datetime(request.headers["If-Modified-Since"]).timestamp():
+                return Response(status_code=304, headers=headers)
+        except (TypeError, ValueError):
+            pass
+    return FileResponse(path, media_type=media_type, headers=headers, stat_result=st)
+
+
 @app.get("/api/stories/{story_id}/image.png")
-async def get_story_image(story_id: str):
+async def get_story_image(story_id: StoryId, request: Request):
     """Serve the story cover image."""
     image_path = settings.AUDIO_OUTPUT_DIR / story_id / "cover.png"
     if not image_path.exists():
         # Fallback to podcast cover if story image is missing
-        image_path = Path(__file__).parent / "static" / "podcast-cover.png"
+        image_path = PODCAST_COVER_PATH
     
     if not image_path.exists():
         raise HTTPException(status_code=404, detail="Image not found")
         
-    return FileResponse(image_path, media_type="image/png")
+    return await _cached_file(request, image_path, "image/png")
 
 
 @app.get("/api/stories/{story_id}/thumb.jpg")
-async def get_story_thumbnail(story_id: str):
+async def get_story_thumbnail(story_id: StoryId, request: Request):
     """Serve a small JPEG thumbnail (256x256) for fast loading in lists."""
     story_dir = settings.AUDIO_OUTPUT_DIR / story_id
     thumb_path = story_dir / "cover_thumb.jpg"
@@ -1439,7 +1654,7 @@ async def get_story_thumbnail(story_id: str):
             return FileResponse(cover_path, media_type="image/png")
         raise HTTPException(status_code=404, detail="Thumbnail not found")
     
-    return FileResponse(thumb_path, media_type="image/jpeg")
+    return await _cached_file(request, thumb_path, "image/jpeg")
 
 
 class SpotifyToggleRequest(BaseModel):
@@ -1447,7 +1662,7 @@ class SpotifyToggleRequest(BaseModel):
 
 
 @app.post("/api/stories/{story_id}/spotify")
-async def toggle_spotify(story_id: str, body: SpotifyToggleRequest, current_user: User = Depends(get_current_active_user)):
+async def toggle_spotify(story_id: StoryId, body: SpotifyToggleRequest, current_user: User = Depends(get_current_active_user)):
     """Toggle whether a story is included in the Spotify RSS feed. Restricted to admins."""
     if not current_user.is_admin:
         raise HTTPException(status_code=403, detail="Not authorized")
@@ -1463,12 +1678,12 @@ async def toggle_spotify(story_id: str, body: SpotifyToggleRequest, current_user
 # ──────────────────────────────────
 
 @app.get("/api/podcast-cover.png")
-async def get_podcast_cover():
+async def get_podcast_cover(request: Request):
     """Serve the podcast cover art."""
-    cover_path = Path(__file__).parent / "static" / "podcast-cover.png"
+    cover_path = PODCAST_COVER_PATH
     if not cover_path.exists():
         raise HTTPException(status_code=404, detail="Cover not found")
-    return FileResponse(cover_path, media_type="image/png")
+    return await _cached_file(request, cover_path, "image/png", PODCAST_COVER_CACHE_CONTROL)
 
 @app.get("/api/users/{user_id}/avatar.jpg")
 async def get_user_avatar(user_id: str):
@@ -1491,45 +1706,96 @@ async def get_user_avatar_thumb(user_id: str):
     return FileResponse(thumb_path, media_type="image/jpeg")
 
 
-@app.get("/api/feed.xml")
-async def get_rss_feed():
-    """Serve the global podcast RSS feed (all public/spotify stories)."""
-    # Only include stories that have is_on_spotify=True
-    stories = store.get_all(only_spotify=True)
-    
-    logger.info(f"Generating global RSS feed with {len(stories)} stories.")
-    
+# Rendered feed: (store.version, cover version), feed-visible fields, xml, gzipped xml, ETag
+_feed_cache: tuple[tuple[int, str], tuple, bytes, bytes, str] | None = None
+FEED_CACHE_CONTROL = "public, max-age=300"
+
+
+def _render_feed() -> tuple[bytes, bytes, str]:
+    """Render the podcast feed as (xml bytes, gzipped xml, ETag), or return the cached entry if nothing changed."""
+    global _feed_cache
+
     # Get version for cache busting based on file modification time
-    cover_path = Path(__file__).parent / "static" / "podcast-cover.png"
+    cover_path = PODCAST_COVER_PATH
     version = "1.0"
     if cover_path.exists():
         version = str(int(cover_path.stat().st_mtime))
+
+    version_key = (store.version, version)
+    if _feed_cache and _feed_cache[0] == version_key:
+        return _feed_cache[2:]
+
+    # Only include stories that have is_on_spotify=True
+    stories = store.get_all(only_spotify=True)
+
+    # store.version also moves on progress ticks of unrelated stories; only re-render
+    # when something that actually appears in the feed has changed
+    feed_fields = (version,) + tuple(
+        (s.id, s.title, s.description, s.created_at, s.image_url, s.duration_seconds)
+        for s in stories
+    )
+    if _feed_cache and _feed_cache[1] == feed_fields:
+        _feed_cache = (version_key,) + _feed_cache[1:]
+        return _feed_cache[2:]
+    
+    logger.info(f"Generating global RSS feed with {len(stories)} stories.")
         
     image_url = f"{settings.BASE_URL}/api/podcast-cover.png?v={version}"
     email = "dirk@proessel.de"
     
+    from app.services.rss_generator import generate_rss_feed
+    xml_content = generate_rss_feed(
+        stories,
+        settings.BASE_URL,
+        image_url=image_url,
+        email=email,
+    )
+    # Content hash rather than store.version: the counter restarts with the process.
+    # The XML holds no render timestamp, so unchanged content keeps its ETag.
+    import hashlib
+    etag = f'W/"{hashlib.md5(xml_content).hexdigest()}"'
+    # Compressed once per render; mtime=0 keeps the bytes stable across renders
+    import gzip
+    gzipped = gzip.compress(xml_content, compresslevel=6, mtime=0)
+    _feed_cache = (version_key, feed_fields, xml_content, gzipped, etag)
+    return xml_content, gzipped, etag
+
+
+@app.on_event("startup")
+async def warm_rss_feed():
+    """Pre-render the feed in the background so boot isn't delayed by the first render."""
+    async def _warm():
+        try:
+            await asyncio.to_thread(_render_feed)
+        except Exception as e:
+            logger.warning(f"RSS warm-up failed: {e}")
+    asyncio.create_task(_warm())
+
+
+@app.get("/api/feed.xml")
+async def get_rss_feed(request: Request):
+    """Serve the global podcast RSS feed (all public/spotify stories)."""
     try:
-        xml_content = generate_rss_feed(
-            stories,
-            settings.BASE_URL,
-            image_url=image_url,
-            email=email,
-        )
-        return Response(content=xml_content, media_type="application/xml")
+        # A re-render queries the DB and builds the XML tree; keep that off the event loop
+        xml_content, gzipped, etag = await asyncio.to_thread(_render_feed)
+        headers = {"Cache-Control": FEED_CACHE_CONTROL, "ETag": etag, "Vary": "Accept-Encoding"}
+        if request.headers.get("If-None-Match") == etag:
+            return Response(status_code=304, headers=headers)
+        if "gzip" in request.headers.get("Accept-Encoding", ""):
+            headers["Content-Encoding"] = "gzip"
+            return Response(content=gzipped, media_type="application/xml", headers=headers)
+        return Response(content=xml_content, media_type="application/xml", headers=headers)
     except Exception as e:
         logger.error(f"RSS Feed error: {e}")
         raise HTTPException(status_code=500, detail="Error generating RSS feed")
 
 
-
-
-
 # ──────────────────────────────────
 # Kindle Export
 # ──────────────────────────────────
 
 @app.post("/api/stories/{story_id}/export-kindle")
-async def export_to_kindle_api(story_id: str, req: KindleExportRequest):
+async def export_to_kindle_api(story_id: StoryId, req: KindleExportRequest):
     """Generate EPUB and send to Kindle via email."""
     meta = store.get_by_id(story_id)
     if not meta:
@@ -1542,13 +1808,14 @@ async def export_to_kindle_api(story_id: str, req: KindleExportRequest):
         raise HTTPException(status_code=404, detail="Story text data missing")
 
     try:
-        story_data = json.loads(text_path.read_text(encoding="utf-8"))
+        story_data = orjson.loads(await asyncio.to_thread(text_path.read_bytes))
         
         # Prepare paths
         epub_path = story_dir / f"{story_id}.epub"
         cover_path = story_dir / "cover.png"
         
         # Generate EPUB (space efficient)
+        from app.services.kindle_service import generate_epub, send_to_kindle
         story_data["id"] = story_id
         await generate_epub(story_data, cover_path if cover_path.exists() else None, epub_path)
         
@@ -1580,14 +1847,25 @@ async def health():
     }
 
 
+# Serialized debug_store payload, keyed by store.version
+_debug_store_cache: tuple[int, bytes] | None = None
+
+
 @app.get("/api/debug/store")
 async def debug_store():
     """Debug endpoint to inspect the store contents."""
+    global _debug_store_cache
+    if _debug_store_cache and _debug_store_cache[0] == store.version:
+        return Response(content=_debug_store_cache[1], media_type="application/json")
+
+    version = store.version
     stories = store.get_all()
-    return {
+    payload = orjson.dumps({
         "count": len(stories),
         "stories": [s.model_dump(mode="json") for s in stories]
-    }
+    })
+    _debug_store_cache = (version, payload)
+    return Response(content=payload, media_type="application/json")
 
 
 # ──────────────────────────────────
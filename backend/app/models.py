@@ -90,7 +90,7 @@ class StoryMeta(SQLModel, table=True):
     status: str = Field(default="done")  # "generating", "done", "error"
     progress: Optional[str] = Field(default=None)
     progress_pct: int = Field(default=0)
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), index=True)
     updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     
     # Multi-User & Remix Features
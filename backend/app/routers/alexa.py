@@ -75,7 +75,7 @@ def get_or_create_alexa_user(alexa_user_id: str, session: Session, access_token:
         raise HTTPException(status_code=403, detail="Guests not allowed")
 
     new_user = User(
-        id=str(uuid.uuid4())[:8],
+        id=uuid.uuid4().hex[:8],
         email=guest_email,
         username=f"Alexa Guest {alexa_user_id[-4:]}",
         hashed_password=get_password_hash(str(uuid.uuid4())),
@@ -107,6 +107,7 @@ def migrate_guest_stories(alexa_user_id: str, target_user_id: str, session: Sess
     # Delete the guest user instead of just deactivating (as requested by user)
     session.delete(guest_user)
     session.commit()
+    store.invalidate()
     
     logger.info(f"MIGRATED {count} stories from guest {guest_user.id} to {target_user_id}. Guest user deleted.")
 
@@ -282,7 +283,7 @@ async def _alexa_webhook_logic(data: dict, session: Session):
                 )
 
             # Start Generation Pipeline
-            story_id = str(uuid.uuid4())[:8]
+            story_id = uuid.uuid4().hex[:8]
             
             # ── Genre Normalization (alle 20 Storyja-Genres) ──
             raw_genre = get_canonical_slot_value(genre_slot)
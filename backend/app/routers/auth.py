@@ -141,6 +141,8 @@ def login_merge(
     # Delete the guest account
     session.delete(current_user)
     session.commit()
+    from app.services.store import store
+    store.invalidate()
 
     # Generate token for real user
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
@@ -408,10 +410,6 @@ async def create_voice_clone(
             # 2. Analyze with Gemini
             if settings.GEMINI_API_KEY and preview_path.exists():
                 logger.info(f"Starting Gemini analysis for voice {new_voice.id}...")
-                from google import genai
-                from google.genai import types
-                import time
-                client = genai.Client(api_key=settings.GEMINI_API_KEY)
                 
                 async def analyze_audio():
                     # Note: We are currently ignoring the audio file content in the unified generate_text 
@@ -12,7 +12,6 @@ from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query, H
 from fastapi.responses import FileResponse, Response
 from pydantic import BaseModel
 from sqlmodel import Session, select
-from google import genai
 from google.genai import types
 
 from app.database import engine
@@ -452,12 +451,11 @@ async def bg_generate_cover(project_id: str, cover_prompt: str, model: Optional[
         
         # Fallback to Imagen (GenAI client)
         if not image_path and settings.GEMINI_API_KEY:
-            client = genai.Client(api_key=settings.GEMINI_API_KEY)
+            from app.services.text_generator import get_gemini_client
             # In Pro Mode, do not limit image size to 512px. Always use aspect_ratio="3:4" to get high-resolution portrait.
             image_cfg = types.ImageConfig(aspect_ratio="3:4")
             
-            response = await asyncio.to_thread(
-                client.models.generate_content,
+            response = await get_gemini_client().aio.models.generate_content(
                 model=model_id,
                 contents=enhanced_prompt,
                 config=types.GenerateContentConfig(
@@ -526,7 +524,7 @@ async def create_book_project(req: BookProjectCreate, current_user: User = Depen
     from app.services.story_generator import generate_modular_prompt
     initial_style = generate_modular_prompt(req.style)
     
-    project_id = str(uuid.uuid4())[:8]
+    project_id = uuid.uuid4().hex[:8]
     project = BookProject(
         id=project_id,
         user_id=current_user.id,
@@ -694,7 +692,7 @@ async def api_generate_outline(
                 pov_char = "Erzähler"
                 
             chapter = BookChapter(
-                id=str(uuid.uuid4())[:8],
+                id=uuid.uuid4().hex[:8],
                 book_project_id=id,
                 chapter_number=ch_data.get("chapter_number"),
                 title=ch_data.get("title", f"Kapitel {ch_data.get('chapter_number')}"),
@@ -742,7 +740,7 @@ async def api_import_outline(
         # Create new chapters in draft state
         for ch_data in outline_res.get("chapters", []):
             chapter = BookChapter(
-                id=str(uuid.uuid4())[:8],
+                id=uuid.uuid4().hex[:8],
                 book_project_id=id,
                 chapter_number=ch_data.get("chapter_number"),
                 title=ch_data.get("title", f"Kapitel {ch_data.get('chapter_number')}"),
@@ -792,7 +790,7 @@ async def api_update_outline_manually(
                 session.add(chapter)
                 active_ids.append(chapter.id)
             else:
-                new_id = ch_data.get("id") or str(uuid.uuid4())[:8]
+                new_id = ch_data.get("id") or uuid.uuid4().hex[:8]
                 new_ch = BookChapter(
                     id=new_id,
                     book_project_id=id,
@@ -1,26 +1,24 @@
 import asyncio
+import functools
+import shutil
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Long-running, CPU-heavy ffmpeg encodes get their own small pool, so concurrent
+# merges neither hog the default executor (used for DB/file to_thread calls)
+# nor oversubscribe the CPU.
+_FFMPEG_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ffmpeg")
 
-async def _create_silence(duration_ms: int, output_path: Path) -> Path:
-    """Generate a silent MP3 of given duration."""
-    await asyncio.to_thread(
-        subprocess.run,
-        [
-            "ffmpeg", "-y",
-            "-f", "lavfi",
-            "-i", f"anullsrc=r=44100:cl=stereo",
-            "-t", str(duration_ms / 1000),
-            "-c:a", "libmp3lame",
-            "-b:a", "64k",
-            str(output_path),
-        ],
-        capture_output=True,
-        check=True,
+
+async def _run_ffmpeg(cmd: list[str]) -> subprocess.CompletedProcess:
+    """Run an ffmpeg command off the event loop on the dedicated encoder pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _FFMPEG_EXECUTOR,
+        functools.partial(subprocess.run, cmd, capture_output=True, text=True, check=False),
     )
-    return output_path
 
 
 async def merge_audio_files(
@@ -31,150 +29,190 @@ async def merge_audio_files(
     title_path: Path | None = None,
     silence_between_ms: int = 1000,
     fade_out_ms: int = 0,
+    skip_normalize: bool = False,
 ) -> Path:
     """
     Merge multiple MP3 files with optional intro/outro, title announcement and normalization.
+
+    With skip_normalize=True the inputs (which must share sample rate/channels/codec,
+    e.g. all from one TTS engine) are stream-copied without decoding or re-encoding.
     """
     if not audio_files:
         raise ValueError("No audio files provided")
 
     if len(audio_files) == 1:
         # Single file: just normalize
-        await _normalize_audio(audio_files[0], output_path, fade_out_ms)
+        if skip_normalize:
+            await _concat_copy([audio_files[0]], output_path)
+        else:
+            await _render_audio([audio_files[0]], output_path, fade_out_ms)
         return output_path
 
-    # We will use FFmpeg's filter_complex concat which is much more robust
-    # against different sample rates and formats than the concat demuxer.
-    # ignore_cleanup_errors=True is critical on Windows to prevent WinError 32
+    # Build list of segments in exact order: a Path is an input file,
+    # an int is a pause of that many milliseconds (generated inside ffmpeg)
+    silence = silence_between_ms
+    segments: list[Path | int] = []
+
+    # 1. Intro
+    if intro_path and intro_path.exists():
+        segments.append(intro_path)
+        segments.append(silence)
+
+    # 1.5 Title Announcement
+    if title_path and title_path.exists():
+        segments.append(title_path)
+        segments.append(silence)
+
+    # 2. Chapters
+    for i, af in enumerate(audio_files):
+        segments.append(af)
+        if i < len(audio_files) - 1:
+            segments.append(silence)
+        elif outro_path and outro_path.exists():
+            segments.append(silence)
+
+    # 3. Outro
+    if outro_path and outro_path.exists():
+        segments.append(silence) # Extrapause vor dem Outro
+        segments.append(outro_path)
+
+    # 4. Final pause
+    segments.append(silence)
+
+    if skip_normalize:
+        await _concat_copy(segments, output_path)
+    else:
+        await _render_audio(segments, output_path, fade_out_ms)
+    return output_path
+
+
+async def _concat_copy(segments: list[Path | int], output_path: Path):
+    """Join segments with the concat demuxer and -c copy: no filter graph, no re-encode."""
+    files = [seg for seg in segments if isinstance(seg, Path)]
+    if len(segments) == 1:
+        await asyncio.to_thread(shutil.copyfile, files[0], output_path)
+        return
+
+    # Pauses must be stream-compatible with the inputs: encode them as CBR MP3
+    # with the first input's sample rate / channel count
+    probe = await asyncio.to_thread(
+        subprocess.run,
+        [
+            "ffprobe",
+            "-v", "error",
+            "-select_streams", "a:0",
+            "-show_entries", "stream=sample_rate,channels",
+            "-of", "default=noprint_wrappers=1:nokey=1",
+            str(files[0]),
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    sample_rate, channels = probe.stdout.split()[:2]
+
     with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmpdir:
         tmpdir = Path(tmpdir)
-        silence_path = tmpdir / "silence.mp3"
-        await _create_silence(silence_between_ms, silence_path)
-
-        # ... (rest of input gathering logic) ...
-        # [Merging logic continues here as before] ...
-        
-        # [I will keep the logic same but nested in the new TemporaryDirectory]
-        # Build list of input files in exact order
-        inputs = []
-        
-        # 1. Intro
-        if intro_path and intro_path.exists():
-            inputs.append(intro_path)
-            inputs.append(silence_path)
-
-        # 1.5 Title Announcement
-        if title_path and title_path.exists():
-            inputs.append(title_path)
-            inputs.append(silence_path)
-
-        # 2. Chapters
-        for i, af in enumerate(audio_files):
-            inputs.append(af)
-            if i < len(audio_files) - 1:
-                inputs.append(silence_path)
-            elif outro_path and outro_path.exists():
-                inputs.append(silence_path)
-
-        # 3. Outro
-        if outro_path and outro_path.exists():
-            inputs.append(silence_path) # Extrapause vor dem Outro
-            inputs.append(outro_path)
-
-        # 4. Final pause
-        inputs.append(silence_path)
-
-        # Construct FFmpeg command
-        cmd = ["ffmpeg", "-y"]
-        for inp in inputs:
-            cmd.extend(["-i", str(inp.resolve())])
-            
-        # Build filter_complex string: standardize each input individually first
-        filter_str = ""
-        for i in range(len(inputs)):
-            filter_str += f"[{i}:a]aresample=44100,aformat=sample_fmts=s16:channel_layouts=stereo[a{i}];"
-            
-        # Then concatenate the normalized streams
-        concat_inputs = "".join([f"[a{i}]" for i in range(len(inputs))])
-        filter_str += f"{concat_inputs}concat=n={len(inputs)}:v=0:a=1[outa]"
-        
-        cmd.extend(["-filter_complex", filter_str, "-map", "[outa]"])
-        
-        merged_raw = tmpdir / "merged_raw.mp3"
-        cmd.extend([
-            "-c:a", "libmp3lame",
-            "-ar", "44100",
-            "-ac", "2",
-            "-b:a", "64k",
-            str(merged_raw)
+        silence_files: dict[int, Path] = {}
+        for ms in {seg for seg in segments if isinstance(seg, int)}:
+            silence_files[ms] = tmpdir / f"silence_{ms}.mp3"
+            result = await _run_ffmpeg([
+                "ffmpeg", "-y",
+                "-f", "lavfi",
+                "-i", f"anullsrc=r={sample_rate}:cl={'stereo' if channels == '2' else 'mono'}",
+                "-t", str(ms / 1000),
+                "-c:a", "libmp3lame",
+                "-b:a", "64k",
+                str(silence_files[ms]),
+            ])
+            if result.returncode != 0:
+                raise RuntimeError(f"FFmpeg silence generation failed:\n{result.stderr}")
+
+        list_path = tmpdir / "concat.txt"
+        lines = []
+        for seg in segments:
+            path = seg.resolve() if isinstance(seg, Path) else silence_files[seg]
+            lines.append("file '" + str(path).replace("'", "'\\''") + "'")
+        list_path.write_text("\n".join(lines), encoding="utf-8")
+
+        result = await _run_ffmpeg([
+            "ffmpeg", "-y",
+            "-f", "concat", "-safe", "0",
+            "-i", str(list_path),
+            "-c", "copy",
+            str(output_path),
         ])
-
-        result = await asyncio.to_thread(
-            subprocess.run,
-            cmd,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-
         if result.returncode != 0:
-            raise RuntimeError(f"FFmpeg merging failed with exit status {result.returncode}:\n{result.stderr}")
-
-        # Normalize + fade out
-        await _normalize_audio(merged_raw, output_path, fade_out_ms)
+            raise RuntimeError(f"FFmpeg concat failed with exit status {result.returncode}:\n{result.stderr}")
 
-        # On Windows, give the OS a moment to release file handles before cleanup starts
-        await asyncio.sleep(0.5)
 
-    return output_path
+async def _render_audio(segments: list[Path | int], output_path: Path, fade_out_ms: int = 0):
+    """
+    Concatenate, loudness-normalize (EBU R128) and encode in a single ffmpeg pass.
+    Each input is decoded once and the MP3 is encoded once.
+    """
+    cmd = ["ffmpeg", "-y"]
+    filter_parts = []
+    files: list[Path] = []
+    silence_ms = 0
 
+    # Standardize each segment individually first. This is much more robust
+    # against different sample rates and formats than the concat demuxer.
+    for i, seg in enumerate(segments):
+        if isinstance(seg, Path):
+            cmd.extend(["-i", str(seg.resolve())])
+            filter_parts.append(f"[{len(files)}:a]aresample=44100,aformat=sample_fmts=s16:channel_layouts=stereo[a{i}]")
+            files.append(seg)
+        else:
+            filter_parts.append(f"aevalsrc=0|0:c=stereo:s=44100:d={seg / 1000},aformat=sample_fmts=s16:channel_layouts=stereo[a{i}]")
+            silence_ms += seg
+
+    concat_inputs = "".join(f"[a{i}]" for i in range(len(segments)))
+    chain = f"{concat_inputs}concat=n={len(segments)}:v=0:a=1,loudnorm=I=-16:TP=-1.5:LRA=11"
 
-async def _normalize_audio(input_path: Path, output_path: Path, fade_out_ms: int = 0):
-    """Normalize loudness and optionally apply fade-out."""
     if fade_out_ms > 0:
-        # Get duration for fade-out calculation
-        probe = await asyncio.to_thread(
-            subprocess.run,
-            [
-                "ffprobe",
-                "-v", "error",
-                "-show_entries", "format=duration",
-                "-of", "default=noprint_wrappers=1:nokey=1",
-                str(input_path),
-            ],
-            capture_output=True,
-            text=True,
-        )
-        duration = float(probe.stdout.strip())
+        # Total length is known from the inputs, no need to probe an intermediate file
+        durations = await asyncio.gather(*(get_audio_duration(f) for f in files))
+        duration = sum(durations) + silence_ms / 1000
         fade_start = max(0, duration - (fade_out_ms / 1000))
+        chain += f",afade=t=out:st={fade_start}:d={fade_out_ms / 1000}"
 
-        # Normalize loudness (EBU R128) + fade out
-        filter_chain = (
-            f"loudnorm=I=-16:TP=-1.5:LRA=11,"
-            f"afade=t=out:st={fade_start}:d={fade_out_ms / 1000}"
-        )
-    else:
-        filter_chain = f"loudnorm=I=-16:TP=-1.5:LRA=11"
+    filter_parts.append(f"{chain}[outa]")
 
-    await asyncio.to_thread(
-        subprocess.run,
-        [
-            "ffmpeg", "-y",
-            "-i", str(input_path),
-            "-af", filter_chain,
-            "-c:a", "libmp3lame",
-            "-ar", "44100",
-            "-ac", "2",
-            "-b:a", "64k",
-            str(output_path),
-        ],
-        capture_output=True,
-        check=True,
-    )
+    cmd.extend([
+        "-filter_complex", ";".join(filter_parts),
+        "-map", "[outa]",
+        "-c:a", "libmp3lame",
+        "-ar", "44100",
+        "-ac", "2",
+        "-b:a", "64k",
+        str(output_path),
+    ])
+
+    result = await _run_ffmpeg(cmd)
+
+    if result.returncode != 0:
+        raise RuntimeError(f"FFmpeg merging failed with exit status {result.returncode}:\n{result.stderr}")
+
+
+def _mp3_duration(file_path: Path) -> float | None:
+    """Read an MP3's length from its frame headers (Xing/VBRI or CBR size), no subprocess."""
+    from mutagen import MutagenError
+    from mutagen.mp3 import MP3
+    try:
+        return MP3(str(file_path)).info.length
+    except MutagenError:
+        return None
 
 
 async def get_audio_duration(file_path: Path) -> float:
     """Get duration of an audio file in seconds."""
+    if file_path.suffix.lower() == ".mp3":
+        duration = await asyncio.to_thread(_mp3_duration, file_path)
+        if duration:
+            return duration
+
+    # Other containers (or an MP3 mutagen can't parse): ask ffprobe
     result = await asyncio.to_thread(
         subprocess.run,
         [
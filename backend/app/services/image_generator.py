@@ -1,12 +1,11 @@
 import asyncio
 import logging
 from pathlib import Path
-from google import genai
 from google.genai import types
 import fal_client
 from app.config import settings
 from app.services.store import store
-from app.services.text_generator import generate_text
+from app.services.text_generator import generate_text, get_gemini_client
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +16,17 @@ SAFETY_SETTINGS_CONFIG = [
     types.SafetySetting(category="HARM_CATEGORY_HARASSMENT", threshold="BLOCK_NONE"),
 ]
 
+GENRE_STYLE_HINTS = {
+    "Sci-Fi": "Futuristic, cinematic concept art, neon accents, detailed textures",
+    "Fantasy": "Epic oil painting, ethereal lighting, rich colors, intricate details",
+    "Krimi": "Neo-noir, high contrast, dramatic shadows, moody atmosphere",
+    "Abenteuer": "Vibrant exploration art, dynamic composition, warm light",
+    "Realismus": "Fine art photography style, natural lighting, sharp focus",
+    "Grusel": "Dark gothic art, misty, psychological horror aesthetic",
+    "Dystopie": "Gritty, industrial, muted tones, post-apocalyptic vibe",
+    "Satire": "Stylized editorial illustration, bold colors, ironic composition"
+}
+
 async def get_visual_prompt(synopsis: str, genre: str, style: str, image_hints: str | None = None) -> str:
     """
     Use Gemini to transform a German synopsis into a visually descriptive English image prompt.
@@ -100,24 +110,11 @@ async def generate_story_image(synopsis: str, output_path: Path, genre: str = "R
         # Get current model from DB or fallback to config
         model_id = store.get_system_setting("gemini_image_model", settings.GEMINI_IMAGE_MODEL)
         logger.info(f"Current Image Model/Provider: {model_id}")
-        
-        # We still need the genai client for Google Imagen models
-        client = genai.Client(api_key=settings.GEMINI_API_KEY)
 
         # Step 1: Use LLM to generate a safe, visual English prompt
         visual_description = await get_visual_prompt(synopsis, genre, style, image_hints)
         
-        style_hints = {
-            "Sci-Fi": "Futuristic, cinematic concept art, neon accents, detailed textures",
-            "Fantasy": "Epic oil painting, ethereal lighting, rich colors, intricate details",
-            "Krimi": "Neo-noir, high contrast, dramatic shadows, moody atmosphere",
-            "Abenteuer": "Vibrant exploration art, dynamic composition, warm light",
-            "Realismus": "Fine art photography style, natural lighting, sharp focus",
-            "Grusel": "Dark gothic art, misty, psychological horror aesthetic",
-            "Dystopie": "Gritty, industrial, muted tones, post-apocalyptic vibe",
-            "Satire": "Stylized editorial illustration, bold colors, ironic composition"
-        }
-        genre_hint = style_hints.get(genre, "Artistic illustration")
+        genre_hint = GENRE_STYLE_HINTS.get(genre, "Artistic illustration")
         
         # Construct the final prompt
         enhanced_prompt = (
@@ -135,23 +132,23 @@ async def generate_story_image(synopsis: str, output_path: Path, genre: str = "R
         # Fallback to Google Imagen
         logger.info(f"Using Google Image model: {model_id}")
         logger.info(f"Final Enhanced Prompt: {enhanced_prompt}")
-        
+
+        # Pro models (Imagen 3) and Flash models have different config requirements
+        if "pro" in model_id.lower():
+            image_cfg = types.ImageConfig(aspect_ratio="1:1")
+        else:
+            image_cfg = types.ImageConfig(image_size="512")
+        image_config = types.GenerateContentConfig(
+            response_modalities=["IMAGE"],
+            image_config=image_cfg,
+            safety_settings=SAFETY_SETTINGS_CONFIG,
+        )
+
         async def call_nano_banana(prompt_text):
-            # Pro models (Imagen 3) and Flash models have different config requirements
-            if "pro" in model_id.lower():
-                image_cfg = types.ImageConfig(aspect_ratio="1:1")
-            else:
-                image_cfg = types.ImageConfig(image_size="512")
-
-            return await asyncio.to_thread(
-                client.models.generate_content,
+            return await get_gemini_client().aio.models.generate_content(
                 model=model_id,
                 contents=prompt_text,
-                config=types.GenerateContentConfig(
-                    response_modalities=["IMAGE"],
-                    image_config=image_cfg,
-                    safety_settings=SAFETY_SETTINGS_CONFIG,
-                )
+                config=image_config,
             )
 
         # Attempt 1: Full optimized prompt
@@ -183,7 +180,7 @@ async def generate_story_image(synopsis: str, output_path: Path, genre: str = "R
 
         if image_bytes:
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_bytes(image_bytes)
+            await asyncio.to_thread(output_path.write_bytes, image_bytes)
             logger.info(f"Image saved successfully to {output_path} (Size: {len(image_bytes)} bytes)")
             return output_path
         else:
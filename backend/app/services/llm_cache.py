@@ -0,0 +1,101 @@
+"""
+Exact-match response cache for LLM calls.
+Responses are stored on disk keyed by the SHA-256 of the canonicalized request payload.
+Identical requests that are in flight at the same time share a single API call.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+from typing import Awaitable, Callable
+
+import orjson
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = settings.AUDIO_OUTPUT_DIR / "llm_cache"
+# Oldest entries (by mtime) are evicted once the cache grows beyond this size
+CACHE_MAX_BYTES = settings.LLM_CACHE_MAX_MB * 1024 * 1024
+
+# Pending API calls by cache key, so concurrent duplicates await the same task
+_inflight: dict[str, asyncio.Task] = {}
+
+
+def cache_key(payload: dict) -> str:
+    canonical = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    return hashlib.sha256(canonical).hexdigest()
+
+
+def _read(path) -> str | None:
+    try:
+        text = orjson.loads(path.read_bytes())["response"]
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"LLM cache entry {path.name} unreadable: {e}")
+        return None
+    # Touch so eviction keeps recently used entries
+    os.utime(path)
+    return text
+
+
+def _write(path, payload: dict, response: str):
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_bytes(orjson.dumps({"request": payload, "response": response}))
+    os.replace(tmp, path)
+    evict_oldest(CACHE_DIR, CACHE_MAX_BYTES, ".json")
+
+
+def evict_oldest(directory, max_bytes: int, suffix: str):
+    """Delete the least recently used files ending in suffix until directory fits in max_bytes."""
+    entries = []
+    for entry in os.scandir(directory):
+        if entry.name.endswith(suffix):
+            st = entry.stat()
+            entries.append((st.st_mtime, st.st_size, entry.path))
+    total = sum(size for _, size, _ in entries)
+    if total <= max_bytes:
+        return
+    for _, size, path in sorted(entries):
+        os.unlink(path)
+        total -= size
+        if total <= max_bytes:
+            break
+
+
+async def single_flight(key_payload: dict, factory: Callable[[], Awaitable[str]], key: str | None = None) -> str:
+    """Run factory() once for all concurrent callers with the same key_payload."""
+    key = key or cache_key(key_payload)
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(factory())
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    else:
+        logger.info(f"LLM request already in flight, joining: {key[:12]}")
+    # Shielded so one caller being cancelled does not cancel the call for the others
+    return await asyncio.shield(task)
+
+
+async def cached_call(key_payload: dict, factory: Callable[[], Awaitable[str]]) -> str:
+    """Return the cached response for key_payload, or run factory() and store its result."""
+    key = cache_key(key_payload)
+    path = CACHE_DIR / f"{key}.json"
+    cached = await asyncio.to_thread(_read, path)
+    if cached is not None:
+        logger.info(f"LLM cache hit: {path.stem[:12]}")
+        return cached
+
+    async def call_and_store() -> str:
+        response = await factory()
+        try:
+            await asyncio.to_thread(_write, path, key_payload, response)
+        except Exception as e:
+            logger.warning(f"Failed to write LLM cache entry: {e}")
+        return response
+
+    return await single_flight(key_payload, call_and_store, key=key)
@@ -12,6 +12,9 @@ from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Quota counters are stats only: coalesce their file writes
+USAGE_SAVE_DELAY = 5.0
+
 class RateLimiter:
     def __init__(self):
         # Default limits
@@ -30,6 +33,7 @@ class RateLimiter:
         self._today = ""
         self._daily_counts = {} # service_name -> count
         self._exhausted_services = set() # service_name -> True (resets daily)
+        self._save_pending = False
         self._load_usage()
 
     def _load_usage(self):
@@ -53,6 +57,25 @@ class RateLimiter:
         except Exception as e:
             logger.error(f"Failed to save API usage: {e}")
 
+    def _schedule_save(self):
+        """Write the usage file at most once per USAGE_SAVE_DELAY instead of on every request."""
+        if self._save_pending:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop (scripts, threads): write through
+            self._save_usage()
+            return
+        self._save_pending = True
+        loop.call_later(USAGE_SAVE_DELAY, self.flush)
+
+    def flush(self):
+        """Persist pending counter updates (also called on shutdown)."""
+        if self._save_pending:
+            self._save_pending = False
+            self._save_usage()
+
     def _check_and_reset_daily(self):
         today_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
         if self._today != today_str:
@@ -80,7 +103,7 @@ class RateLimiter:
         """Records a request for stats, but does not block."""
         self._check_and_reset_daily()
         self._daily_counts[service] = self._daily_counts.get(service, 0) + 1
-        self._save_usage()
+        self._schedule_save()
 
     async def wait_for_capacity(self, service: str = "tts"):
         """
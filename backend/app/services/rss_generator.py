@@ -2,9 +2,37 @@
 Podcast RSS feed generator for bedtime stories.
 """
 
+import os
+import tempfile
 from datetime import datetime, timezone
+from email.utils import format_datetime
+from functools import lru_cache
 from pathlib import Path
-from feedgen.feed import FeedGenerator
+from lxml import etree
+
+FEED_DESCRIPTION = "Storyja.com – Literatur auf Knopfdruck. Wir verwandeln deine Ideen in Sekunden in individuell generierte Kurzgeschichten. Von messerscharfer Satire bis zum tiefgründigen Drama: Erlebe im Kurzgeschichten-Labor, wie KI die Kunst des Erzählens neu definiert."
+FEED_AUTHOR = "storyja.com"
+FEED_CATEGORIES = (("Fiction", "Short Stories"), ("Kids & Family", "Stories for Kids"))
+
+ITUNES_NS = "http://www.itunes.com/dtds/podcast-1.0.dtd"
+NSMAP = {
+    "itunes": ITUNES_NS,
+    "atom": "http://www.w3.org/2005/Atom",
+    "content": "http://purl.org/rss/1.0/modules/content/",
+}
+_ITUNES = f"{{{ITUNES_NS}}}"
+
+
+def _sub(parent, tag: str, value: str | None = None, **attrib):
+    el = etree.SubElement(parent, tag, attrib)
+    if value is not None:
+        el.text = value
+    return el
+
+
+def _as_utc(dt: datetime) -> datetime:
+    # SQLite returns naive datetimes; they are stored as UTC
+    return dt.replace(tzinfo=timezone.utc) if dt.tzinfo is None else dt
 
 
 def generate_rss_feed(
@@ -13,88 +41,105 @@ def generate_rss_feed(
     image_url: str | None = None,
     email: str | None = None,
     title: str = "Kurzgeschichten-Labor",
-) -> str:
+    *,
+    output_path: Path | None = None,
+) -> bytes:
     """
     Generate a podcast-compatible RSS feed XML.
 
+    The fixed podcast schema is written straight into an lxml tree (text is
+    escaped by lxml), without an intermediate feed object model.
+
     Args:
-        stories: List of story dicts or StoryMeta Pydantic models.
+        stories: StoryMeta models (or responses), newest first.
         base_url: Base URL where audio files are served
+        output_path: Optionally also write the feed there (atomically)
 
     Returns:
-        The RSS XML string
+        The UTF-8 encoded RSS XML
     """
-    fg = FeedGenerator()
-    fg.load_extension("podcast")
+    root = etree.Element("rss", nsmap=NSMAP, version="2.0")
+    channel = _sub(root, "channel")
 
     # Feed metadata
-    fg.title(title)
-    fg.link(href=base_url, rel="alternate")
-    desc = "Storyja.com – Literatur auf Knopfdruck. Wir verwandeln deine Ideen in Sekunden in individuell generierte Kurzgeschichten. Von messerscharfer Satire bis zum tiefgründigen Drama: Erlebe im Kurzgeschichten-Labor, wie KI die Kunst des Erzählens neu definiert."
-    fg.description(desc)
-    fg.language("de-DE")
-    
-    fg.podcast.itunes_category("Fiction", "Short Stories")
-    fg.podcast.itunes_category("Kids & Family", "Stories for Kids")
-    
-    fg.podcast.itunes_author("storyja.com")
-    fg.podcast.itunes_explicit("no")
-    fg.podcast.itunes_summary(desc)
-
+    _sub(channel, "title", title)
+    _sub(channel, "link", base_url)
+    _sub(channel, "description", FEED_DESCRIPTION)
+    _sub(channel, "docs", "http://www.rssboard.org/rss-specification")
     if image_url:
-        fg.logo(image_url)
-        fg.podcast.itunes_image(image_url)
+        image = _sub(channel, "image")
+        _sub(image, "url", image_url)
+        _sub(image, "title", title)
+        _sub(image, "link", base_url)
+    _sub(channel, "language", "de-DE")
+    # Derived from the newest episode (not the render time) so identical content renders identical bytes
+    last_build = max((_as_utc(story.created_at) for story in stories), default=datetime(1970, 1, 1, tzinfo=timezone.utc))
+    _sub(channel, "lastBuildDate", format_datetime(last_build))
 
+    _sub(channel, _ITUNES + "author", FEED_AUTHOR)
+    for category, subcategory in FEED_CATEGORIES:
+        cat = _sub(channel, _ITUNES + "category", text=category)
+        _sub(cat, _ITUNES + "category", text=subcategory)
+    if image_url:
+        _sub(channel, _ITUNES + "image", href=image_url)
+    _sub(channel, _ITUNES + "explicit", "no")
     if email:
-        fg.podcast.itunes_owner(name="storyja.com", email=email)
+        owner = _sub(channel, _ITUNES + "owner")
+        _sub(owner, _ITUNES + "name", FEED_AUTHOR)
+        _sub(owner, _ITUNES + "email", email)
+    _sub(channel, _ITUNES + "summary", FEED_DESCRIPTION)
+
+    root_url = base_url.rstrip("/")
 
     # Add episodes (newest first)
-    for s in stories:
-        # Normalize to dict if it's a Pydantic model
-        story = s.model_dump(mode="json") if hasattr(s, "model_dump") else s
-        
-        fe = fg.add_entry()
-        fe.id(f"{base_url}/audio/{story['id']}")
-        fe.title(story["title"])
-        fe.description(story.get("description", ""))
-
-        audio_url = f"{base_url}/api/stories/{story['id']}/audio"
-        fe.enclosure(audio_url, 0, "audio/mpeg")
-        
-        # Add episode-specific image if available
-        # Note: Feedgen requires setting the image directly via the iTunes extension at the item level
-        img_url = story.get("image_url")
+    for story in stories:
+        item = _sub(channel, "item")
+        _sub(item, "title", story.title)
+        if story.description:
+            _sub(item, "description", story.description)
+        _sub(item, "guid", f"{base_url}/audio/{story.id}", isPermaLink="false")
+        _sub(item, "enclosure", url=f"{base_url}/api/stories/{story.id}/audio", length="0", type="audio/mpeg")
+
+        _sub(item, "pubDate", format_datetime(_as_utc(story.created_at)))
+
+        # Episode-specific image if available, else the general podcast cover
+        img_url = story.image_url
         if img_url:
             if img_url.startswith("/"):
                 # Always ensure base_url does not end with a slash to avoid double slashes,
                 # assuming img_url starts with a slash.
-                img_url = f"{base_url.rstrip('/')}{img_url}"
-            fe.podcast.itunes_image(img_url)
+                img_url = f"{root_url}{img_url}"
         else:
-            # Fallback to general podcast cover
-            fe.podcast.itunes_image(f"{base_url.rstrip('/')}/api/podcast-cover.png")
+            img_url = f"{root_url}/api/podcast-cover.png"
+        _sub(item, _ITUNES + "image", href=img_url)
+
+        _sub(item, _ITUNES + "duration", _seconds_to_hms(int(story.duration_seconds or 0)))
 
-        fe.podcast.itunes_duration(
-            _seconds_to_hms(story.get("duration_seconds", 0))
-        )
+    xml = etree.tostring(root, xml_declaration=True, encoding="UTF-8")
+    if output_path is not None:
+        _write_atomic(Path(output_path), xml)
+    return xml
 
-        created = story.get("created_at")
-        if isinstance(created, str):
-            created = datetime.fromisoformat(created)
-        if created.tzinfo is None:
-            created = created.replace(tzinfo=timezone.utc)
-        fe.published(created)
 
-    return fg.rss_str(pretty=True).decode("utf-8")
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write via a temp file in the same directory so readers never see a partial feed."""
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
 
 
-def _seconds_to_hms(seconds: float | None) -> str:
-    """Convert seconds to HH:MM:SS format."""
-    if seconds is None:
+@lru_cache(maxsize=1024)
+def _seconds_to_hms(seconds: int) -> str:
+    """Convert whole seconds to HH:MM:SS format."""
+    if seconds <= 0:
         return "00:00"
-    h = int(seconds // 3600)
-    m = int((seconds % 3600) // 60)
-    s = int(seconds % 60)
-    if h > 0:
+    m, s = divmod(seconds, 60)
+    h, m = divmod(m, 60)
+    if h:
         return f"{h:02d}:{m:02d}:{s:02d}"
     return f"{m:02d}:{s:02d}"
@@ -11,6 +11,12 @@ import uuid
 
 logger = logging.getLogger(__name__)
 
+def _to_response(row: StoryMeta) -> StoryMetaResponse:
+    """Wrap a loaded row without re-validating it: SQLAlchemy already typed every column,
+    and StoryMeta's model_validate costs ~6x more than construct for list reads."""
+    return StoryMetaResponse.model_construct(**row.model_dump())
+
+
 def parse_date(date_val):
     if not date_val:
         return None
@@ -34,6 +40,10 @@ class MessageLog(SQLModel, table=True):
 
 class StoryStore:
     def __init__(self):
+        # Bumped on every story mutation so callers can cache derived views (e.g. RSS)
+        self.version = 0
+        # Validated snapshot of the unfiltered story list: (version, stories)
+        self._all_cache: tuple[int, list[StoryMetaResponse]] | None = None
         # Create DB tables if they don't exist
         create_db_and_tables()
         # Seed admin with is_admin=True but don't force ID syncs or ownership transfers
@@ -159,6 +169,12 @@ class StoryStore:
 
     def get_all(self, only_spotify: bool = False, user_id: str | None = None, genre: list[str] | None = None, search: str | None = None, requesting_user_id: str | None = None) -> list[StoryMeta]:
         """Get all stories with optional filtering, sorted by creation date (newest first)."""
+        unfiltered = not (only_spotify or user_id or genre or search or requesting_user_id)
+        version = self.version
+        if unfiltered and self._all_cache and self._all_cache[0] == version:
+            # Callers annotate the results (user_email, is_favorite), so hand out copies
+            return [s.model_copy() for s in self._all_cache[1]]
+
         from sqlmodel import or_
         with Session(engine) as session:
             statement = select(StoryMeta).order_by(StoryMeta.created_at.desc())
@@ -190,7 +206,7 @@ class StoryStore:
                     )
             
             results = session.exec(statement).all()
-            stories = [StoryMetaResponse.model_validate(s) for s in results]
+            stories = [_to_response(s) for s in results]
 
             # Populate is_favorite if requesting_user_id is provided
             if requesting_user_id and stories:
@@ -203,7 +219,10 @@ class StoryStore:
                 for s in stories:
                     s.is_favorite = s.id in fav_ids
 
-            return stories
+        if unfiltered:
+            self._all_cache = (version, stories)
+            return [s.model_copy() for s in stories]
+        return stories
 
 
     def get_all_users(self) -> list[User]:
@@ -255,7 +274,7 @@ class StoryStore:
             if not db_story:
                 return None
             
-            story = StoryMetaResponse.model_validate(db_story)
+            story = _to_response(db_story)
             if requesting_user_id:
                 fav = session.exec(
                     select(UserFavorite).where(
@@ -286,12 +305,17 @@ class StoryStore:
                 session.commit()
                 return True
                 
+    def get_favorite_ids(self, user_id: str) -> set[str]:
+        """Get the ids of all stories a user has favorited."""
+        with Session(engine) as session:
+            return set(session.exec(select(UserFavorite.story_id).where(UserFavorite.user_id == user_id)).all())
+
     def get_favorites(self, user_id: str) -> list[StoryMetaResponse]:
         """Get all favorited stories for a user."""
         with Session(engine) as session:
             statement = select(StoryMeta).join(UserFavorite).where(UserFavorite.user_id == user_id).order_by(UserFavorite.created_at.desc())
             results = session.exec(statement).all()
-            stories = [StoryMetaResponse.model_validate(s) for s in results]
+            stories = [_to_response(s) for s in results]
             for s in stories:
                 s.is_favorite = True
             return stories
@@ -310,6 +334,20 @@ class StoryStore:
             else:
                 session.add(story)
             session.commit()
+        self.version += 1
+
+    def patch(self, story_id: str, **fields) -> bool:
+        """Update only the given columns of a story, without a full model round-trip."""
+        with Session(engine) as session:
+            story = session.get(StoryMeta, story_id)
+            if not story:
+                return False
+            for key, value in fields.items():
+                setattr(story, key, value)
+            session.add(story)
+            session.commit()
+        self.version += 1
+        return True
 
     def update_spotify_status(self, story_id: str, enabled: bool) -> bool:
         """Toggle Spotify status for a story."""
@@ -319,9 +357,14 @@ class StoryStore:
                 story.is_on_spotify = enabled
                 session.add(story)
                 session.commit()
+                self.version += 1
                 return True
             return False
 
+    def invalidate(self):
+        """Mark cached story lists stale after StoryMeta rows were written outside the store."""
+        self.version += 1
+
     def delete_story(self, story_id: str) -> bool:
         """Remove a story from the database."""
         with Session(engine) as session:
@@ -329,6 +372,7 @@ class StoryStore:
             if story:
                 session.delete(story)
                 session.commit()
+                self.version += 1
                 return True
             return False
 
@@ -343,7 +387,7 @@ class StoryStore:
                 PlaylistEntry.user_id == user_id
             ).order_by(PlaylistEntry.position.asc())
             results = session.exec(statement).all()
-            return [StoryMetaResponse.model_validate(s) for s in results]
+            return [_to_response(s) for s in results]
 
     def add_to_playlist(self, user_id: str, story_id: str) -> bool:
         """Add a story to the end of the user's playlist if eligible."""
@@ -478,7 +522,7 @@ class StoryStore:
             
             # 3. Create new shadow user if no existing account found
             new_user = User(
-                id=f"wa-{str(uuid.uuid4())[:8]}",
+                id=f"wa-{uuid.uuid4().hex[:8]}",
                 email=email,
                 hashed_password="WHATSAPP_SHADOW_USER", # No password login possible
                 username=f"WhatsApp ({clean_phone})"
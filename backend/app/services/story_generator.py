@@ -3,22 +3,29 @@ Story generation service using Google Gemini Flash.
 Two-step process: 1) Generate outline  2) Write detailed chapters
 """
 
-from google import genai
 from app.config import settings
 import asyncio
 import json
+import random
 import re
+import orjson
 from app.services.text_generator import generate_text
 from app.services.rate_limiter import rate_limiter
 from app.services.store import store
 import logging
 from pydantic import BaseModel
 
+# JSON cleanup for LLM responses
+_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+_FENCE_RE = re.compile(r"^```(?:json)?\s*\n?|\n?```\s*$")
+_TRAILING_COMMA_RE = re.compile(r",\s*([}\]])")
+
 class StorySegment(BaseModel):
     plot_action: str
     setting: str
     emotional_shift: str
     ending_note: str
+    end_state: str = ""
 
 class OutlineSchema(BaseModel):
     title: str
@@ -37,6 +44,26 @@ class SinglePassSchema(BaseModel):
 logger = logging.getLogger(__name__)
 
 
+def _parse_llm_json(text: str) -> dict:
+    """Parse a JSON LLM response.
+
+    Schema-constrained Gemini output parses on the first try; the cleanup only runs
+    for models that ignore response_schema (e.g. DeepSeek) or wrap the JSON in prose.
+    """
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        pass
+    # Robust JSON extraction: Find the first { and the last }, else strip markdown fences
+    json_match = _JSON_OBJECT_RE.search(text)
+    text = json_match.group(0) if json_match else _FENCE_RE.sub("", text).strip()
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError as json_err:
+        logger.warning(f"JSON parse failed: {json_err}. Attempting aggressive cleanup...")
+        return orjson.loads(_TRAILING_COMMA_RE.sub(r"\1", text))
+
+
 # Centralized models now coming from app.config.settings
 
 STANZWERK_BIBLIOTHEK = {
@@ -333,8 +360,6 @@ GENRE_HOOKS_LIBRARY = {
 async def generate_story_hook(genre: str, author_id: str, user_input: str | None = None) -> str:
     """Generate a story hook using a multi-example few-shot prompt."""
     
-    import random
-    
     # 1. Get genre-specific example
     genre_example = GENRE_HOOKS_LIBRARY.get(genre, GENRE_HOOKS_LIBRARY["Abenteuer"])
     
@@ -388,8 +413,7 @@ DEIN HOOK:"""
         # We stop doing aggressive trimming to see if the model can now finish its work
         return hook_text
     except Exception as e:
-        import logging
-        logging.error(f"Failed to generate hook: {e}")
+        logger.error(f"Failed to generate hook: {e}")
         return "Ein Toaster erwacht und fragt nach dem Sinn des Brotes."
 
 async def generate_full_story(
@@ -405,13 +429,14 @@ async def generate_full_story(
     multi_voice: bool = False,
     supports_emotions: bool = False,
     is_kids_book: bool = False,
+    on_chapter: callable = None, # on_chapter(index, text), awaited as soon as a chapter's text is final
 ) -> dict:
     # Due to LLM word length limits (~1000 words max per request), 
     # we always use the multi-pass (chapter-by-chapter) generation.
     return await _generate_multi_pass(
         prompt, genre, style, characters, target_minutes, on_progress,
         remix_type, further_instructions, parent_text,
-        multi_voice, supports_emotions, is_kids_book
+        multi_voice, supports_emotions, is_kids_book, on_chapter
     )
 
 
@@ -441,25 +466,57 @@ async def _api_request_with_retry(func, *args, on_progress=None, max_retries=3,
                 continue
             raise e
 
-async def _generate_single_pass(
-    prompt, genre, style, characters, target_minutes, on_progress,
-    remix_type=None, further_instructions=None, parent_text=None,
-    multi_voice=False, supports_emotions=False, is_kids_book=False
-):
-    """Original single-pass logic for shorter stories with improved JSON cleanup."""
-    selected_style_info = generate_modular_prompt(style)
-    genre_data = GENRES_BIBLIOTHEK.get(genre, GENRES_BIBLIOTHEK["Abenteuer"])
-    # 150 words per minute is a better target for a richer story without being too dense
-    word_count = target_minutes * 150
-    char_text = f"\nHauptcharaktere: {', '.join(characters)}" if characters else ""
-    user_hook = prompt
+# ──────────────────────────────────────────────
+# Shared prompt building blocks
+# ──────────────────────────────────────────────
+
+# 150 words per minute is a better target for a richer story without being too dense
+WORDS_PER_MINUTE = 150
 
-    # Context for remix
-    remix_context = ""
+# German prose runs at roughly 1.8 tokens per word; chapters may overshoot their target a bit
+TOKENS_PER_WORD = 1.8
+MAX_OUTPUT_TOKENS = 8192
+
+def _chapter_token_budget(target_words: int) -> int:
+    """Output token budget for a chapter of about target_words words."""
+    return min(MAX_OUTPUT_TOKENS, int(target_words * 1.3 * TOKENS_PER_WORD) + 256)
+
+def _outline_token_budget(num_segments: int) -> int:
+    """Output token budget for the outline JSON (title, synopsis and five short fields per segment)."""
+    return min(MAX_OUTPUT_TOKENS, 512 + 400 * num_segments)
+
+KIDS_STYLE_PROMPT = (
+    "\n\n🧒 KINDER-STIL AKTIV (WICHTIG):\n"
+    "Diese Geschichte richtet sich an Kinder. Sie darf unter keinen Umständen 'verkopft', trocken oder kompliziert geschrieben sein!\n"
+    "Beachte unbedingt folgende Regeln:\n"
+    "1. DIREKT & BILDHAFT: Erzähle lebendig, aktiv und szenisch. Vermeide lange gedankliche Monologe, komplexe innere Reflexionen und psychologisches Sezieren.\n"
+    "2. SPRACHE: Benutze kurze, dynamische Sätze. Keine Schachtelsätze. Verwende einfache, bildhafte Begriffe auf Augenhöhe der Kinder.\n"
+    "3. DIALOG & INTERAKTION: Setze auf witzige, direkte Dialoge und unmittelbare physische Aktionen. Zeige Humor und Spaß!\n"
+    "4. EMOTIONEN: Zeige Gefühle (Wut, Freude, Überraschung) durch direktes Handeln oder greifbare körperliche Reaktionen (Show, don't tell auf kindgerechte Weise), statt sie abstrakt zu erklären.\n"
+    "5. INSPIRATION: Orientiere dich an Kinderbuch-Bestsellern wie Alice Pantermüllers Lotta-Leben (chaotisch, frech, rotziger Plauderton) oder Jeff Kinneys Gregs Tagebuch (einfach, authentisch, witzig-peinlicher Alltag).\n"
+)
+
+
+# Fixed rules at the head of every chapter prompt (kept free of per-story values)
+CHAPTER_INSTRUCTIONS_PREFIX = """Schreibe das nächste chronologische Kapitel der Geschichte.
+ 
+STRIKTE REGELN:
+1. NATÜRLICHER RHYTHMUS: Achte auf einen abwechslungsreichen Satzbau. Nutze sowohl kurze, prägnante Aussagen als auch elegante Nebensätze, um einen flüssigen Leserythmus zu erzeugen. Ideal für Audio/TTS, um Monotonie zu vermeiden. Vermeide jedoch extrem überladene Schachtelsätze.
+2. Vermeide jegliche Floskeln, pädagogische Zeigefinger oder moralische Zusammenfassungen am Ende. Kein Kitsch, keine Moral!
+3. Show, don't tell: Erkläre nicht, wie sich Charaktere fühlen – zeige es durch ihre Handlungen und Reaktionen.
+4. Pacing & Detail: Beschreibe präzise und atmosphärisch. Behandle diesen Abschnitt mit der Tiefe eines Romans. Springe nicht zu schnell in der Handlung voran.
+5. VERMEIDE ÜBEREILTE ENDEN: Hetze nicht zum Schluss. Vermeide Floskeln wie "Und so lernten sie..." oder "Am Ende war alles...". Bleib im Moment der Szene.
+6. Format: Keinerlei Überschriften, Kapitelnummern oder Titel im generierten Text! Nur der reine, fließende Erzähltext.
+7. FORTSCHRITT STATT WIEDERHOLUNG: Wiederhole niemals Phrasen, Metaphern oder innere Monologe aus den vorherigen Kapiteln. Fasse das Bisherige nicht zusammen. Die Handlung MUSS aktiv voranschreiten. Bringe ununterbrochen neue, frische Details ein.
+8. KEIN MARKDOWN: Benutze unter keinen Umständen Markdown-Sternchen (*) oder Unterstriche (_), um Gedanken, Betonungen oder wörtliche Rede hervorzuheben. Nutze für wörtliche Rede stattdessen klassische deutsche Anführungszeichen (z. B. „...“ oder »...«)."""
+
+
+def _build_remix_context(remix_type, further_instructions, parent_text) -> str:
+    """Remix instructions (improvement or sequel) appended to the story prompts."""
     if remix_type == "improvement" and parent_text:
         # For improvements, we treat the LLM as an editor
         original_story_str = json.dumps(parent_text, ensure_ascii=False)
-        remix_context = f"""
+        return f"""
 ### REMIX-MODUS: VERBESSERUNG (EDITOR)
 DIES IST EINE GEZIELTE ÜBERARBEITUNG DER FOLGENDEN GESCHICHTE:
 {original_story_str}
@@ -475,20 +532,31 @@ WICHTIGE REGELN FÜR DIESEN MODUS:
     elif remix_type == "sequel" and parent_text:
         parent_synopsis = parent_text.get("synopsis", "Teil 1")
         parent_title = parent_text.get("title", "Die erste Geschichte")
-        remix_context = f"\n\nDIES IST EINE FORTSETZUNG (SEQUEL) ZU:\nTitel: {parent_title}\nZusammenfassung von Teil 1: {parent_synopsis}\n\nANWEISUNGEN FÜR DIE FORTSETZUNG:\n{further_instructions or 'Erzähle die Geschichte weiter.'}"
-
-    kids_prompt = ""
-    if is_kids_book:
-        kids_prompt = (
-            "\n\n🧒 KINDER-STIL AKTIV (WICHTIG):\n"
-            "Diese Geschichte richtet sich an Kinder. Sie darf unter keinen Umständen 'verkopft', trocken oder kompliziert geschrieben sein!\n"
-            "Beachte unbedingt folgende Regeln:\n"
-            "1. DIREKT & BILDHAFT: Erzähle lebendig, aktiv und szenisch. Vermeide lange gedankliche Monologe, komplexe innere Reflexionen und psychologisches Sezieren.\n"
-            "2. SPRACHE: Benutze kurze, dynamische Sätze. Keine Schachtelsätze. Verwende einfache, bildhafte Begriffe auf Augenhöhe der Kinder.\n"
-            "3. DIALOG & INTERAKTION: Setze auf witzige, direkte Dialoge und unmittelbare physische Aktionen. Zeige Humor und Spaß!\n"
-            "4. EMOTIONEN: Zeige Gefühle (Wut, Freude, Überraschung) durch direktes Handeln oder greifbare körperliche Reaktionen (Show, don't tell auf kindgerechte Weise), statt sie abstrakt zu erklären.\n"
-            "5. INSPIRATION: Orientiere dich an Kinderbuch-Bestsellern wie Alice Pantermüllers Lotta-Leben (chaotisch, frech, rotziger Plauderton) oder Jeff Kinneys Gregs Tagebuch (einfach, authentisch, witzig-peinlicher Alltag).\n"
-        )
+        return f"\n\nDIES IST EINE FORTSETZUNG (SEQUEL) ZU:\nTitel: {parent_title}\nZusammenfassung von Teil 1: {parent_synopsis}\n\nANWEISUNGEN FÜR DIE FORTSETZUNG:\n{further_instructions or 'Erzähle die Geschichte weiter.'}"
+    return ""
+
+
+def _prompt_intro(style, genre, characters, is_kids_book, remix_type=None, further_instructions=None, parent_text=None):
+    """Style, genre and remix snippets shared by the single- and multi-pass prompts."""
+    selected_style_info = generate_modular_prompt(style)
+    genre_data = GENRES_BIBLIOTHEK.get(genre, GENRES_BIBLIOTHEK["Abenteuer"])
+    char_text = f"\nHauptcharaktere: {', '.join(characters)}" if characters else ""
+    kids_prompt = KIDS_STYLE_PROMPT if is_kids_book else ""
+    remix_context = _build_remix_context(remix_type, further_instructions, parent_text)
+    return selected_style_info, genre_data, char_text, kids_prompt, remix_context
+
+
+async def _generate_single_pass(
+    prompt, genre, style, characters, target_minutes, on_progress,
+    remix_type=None, further_instructions=None, parent_text=None,
+    multi_voice=False, supports_emotions=False, is_kids_book=False
+):
+    """Original single-pass logic for shorter stories with improved JSON cleanup."""
+    selected_style_info, genre_data, char_text, kids_prompt, remix_context = _prompt_intro(
+        style, genre, characters, is_kids_book, remix_type, further_instructions, parent_text
+    )
+    word_count = target_minutes * WORDS_PER_MINUTE
+    user_hook = prompt
 
     master_prompt = f"""Du bist ein preisgekrönter Autor. Schreibe eine abgeschlossene Kurzgeschichte.
 
@@ -535,50 +603,9 @@ Antworte EXKLUSIV im validen JSON-Format. WICHTIG: Entwerte (escape) alle Anfüh
     )
     rate_limiter.increment_daily_quota()
 
-    text = response_text.strip()
-    
-    # Robust JSON extraction: Find the first { and the last }
-    json_match = re.search(r'\{.*\}', text, re.DOTALL)
-    if json_match:
-        text = json_match.group(0)
-    else:
-        # Fallback to basic markdown cleanup if regex fails
-        if text.startswith("```json"):
-            text = text.replace("```json", "", 1).replace("```", "", 1).strip()
-        elif text.startswith("```"):
-            text = text.replace("```", "", 2).strip()
+    data = _parse_llm_json(response_text.strip())
 
-    try:
-        data = json.loads(text)
-    except Exception as json_err:
-        logger.warning(f"Single-pass JSON parse failed: {json_err}. Attempting aggressive cleanup...")
-        text = re.sub(r',\s*\}', '}', text)
-        text = re.sub(r',\s*\]', ']', text)
-        try:
-            data = json.loads(text)
-        except:
-            raise json_err
-        # Handle cases where full_text itself contains JSON (recursive LLM error)
-        story_content = data.get("full_text", "")
-        if isinstance(story_content, dict):
-            story_content = story_content.get("full_text", str(story_content))
-        story_content = story_content.replace("*", "")
-            
-        return {
-            "title": data.get("title", "Eine neue Geschichte"),
-            "synopsis": data.get("synopsis", "Kurzgeschichte"),
-            "chapters": [{"title": "Geschichte", "text": story_content}]
-        }
-    except Exception as e:
-        import logging
-        logging.error(f"Failed to parse story JSON: {e}. Raw: {text[:200]}")
-        return {
-            "title": "Anomalie im Labor", 
-            "synopsis": "Die Geschichte konnte nicht korrekt formatiert werden.", 
-            "chapters": [{"title": "Text", "text": text.replace("*", "")}]
-        }
-    
-    # Handle success case (where json.loads succeeded)
+    # Handle cases where full_text itself contains JSON (recursive LLM error)
     story_content = data.get("full_text", "")
     if isinstance(story_content, dict):
         story_content = story_content.get("full_text", str(story_content))
@@ -594,53 +621,15 @@ Antworte EXKLUSIV im validen JSON-Format. WICHTIG: Entwerte (escape) alle Anfüh
 async def _generate_multi_pass(
     prompt, genre, style, characters, target_minutes, on_progress,
     remix_type=None, further_instructions=None, parent_text=None,
-    multi_voice=False, supports_emotions=False, is_kids_book=False
+    multi_voice=False, supports_emotions=False, is_kids_book=False, on_chapter=None
 ):
     """Two-step generation for long stories to ensure length and flow."""
-    selected_style_info = generate_modular_prompt(style)
-    genre_data = GENRES_BIBLIOTHEK.get(genre, GENRES_BIBLIOTHEK["Abenteuer"])
+    selected_style_info, genre_data, char_text, kids_prompt, remix_context = _prompt_intro(
+        style, genre, characters, is_kids_book, remix_type, further_instructions, parent_text
+    )
     user_hook = prompt
-    char_text = f"\nHauptcharaktere: {', '.join(characters)}" if characters else ""
-    
-    kids_prompt = ""
-    if is_kids_book:
-        kids_prompt = (
-            "\n\n🧒 KINDER-STIL AKTIV (WICHTIG):\n"
-            "Diese Geschichte richtet sich an Kinder. Sie darf unter keinen Umständen 'verkopft', trocken oder kompliziert geschrieben sein!\n"
-            "Beachte unbedingt folgende Regeln:\n"
-            "1. DIREKT & BILDHAFT: Erzähle lebendig, aktiv und szenisch. Vermeide lange gedankliche Monologe, komplexe innere Reflexionen und psychologisches Sezieren.\n"
-            "2. SPRACHE: Benutze kurze, dynamische Sätze. Keine Schachtelsätze. Verwende einfache, bildhafte Begriffe auf Augenhöhe der Kinder.\n"
-            "3. DIALOG & INTERAKTION: Setze auf witzige, direkte Dialoge und unmittelbare physische Aktionen. Zeige Humor und Spaß!\n"
-            "4. EMOTIONEN: Zeige Gefühle (Wut, Freude, Überraschung) durch direktes Handeln oder greifbare körperliche Reaktionen (Show, don't tell auf kindgerechte Weise), statt sie abstrakt zu erklären.\n"
-            "5. INSPIRATION: Orientiere dich an Kinderbuch-Bestsellern wie Alice Pantermüllers Lotta-Leben (chaotisch, frech, rotziger Plauderton) oder Jeff Kinneys Gregs Tagebuch (einfach, authentisch, witzig-peinlicher Alltag).\n"
-        )
 
-    
-    # Context for remix
-    remix_context = ""
-    if remix_type == "improvement" and parent_text:
-        # For improvements, we treat the LLM as an editor
-        original_story_str = json.dumps(parent_text, ensure_ascii=False)
-        remix_context = f"""
-### REMIX-MODUS: VERBESSERUNG (EDITOR)
-DIES IST EINE GEZIELTE ÜBERARBEITUNG DER FOLGENDEN GESCHICHTE:
-{original_story_str}
-
-SPEZIELLE ANWEISUNGEN FÜR DIE VERBESSERUNG:
-{further_instructions or 'Mache die Geschichte einfach besser.'}
-
-WICHTIGE REGELN FÜR DIESEN MODUS:
-1. BEWAHRE DEN KERN: Behalte die grundlegende Handlung, die Namen der Charaktere und die Schauplätze bei, sofern sie nicht explizit geändert werden sollen.
-2. PUNKTUELLE EDITS: Ändere nur, was nötig ist, um die 'Speziellen Anweisungen' zu erfüllen oder um den Stil zu optimieren.
-3. KONTINUITÄT: Die neue Version muss sich wie eine verbesserte Fassung des Originals anfühlen, nicht wie eine völlig neue Geschichte.
-"""
-    elif remix_type == "sequel" and parent_text:
-        parent_synopsis = parent_text.get("synopsis", "Teil 1")
-        parent_title = parent_text.get("title", "Die erste Geschichte")
-        remix_context = f"\n\nDIES IST EINE FORTSETZUNG (SEQUEL) ZU:\nTitel: {parent_title}\nZusammenfassung von Teil 1: {parent_synopsis}\n\nANWEISUNGEN FÜR DIE FORTSETZUNG:\n{further_instructions or 'Erzähle die Geschichte weiter.'}"
-
-    # Target total words. 150 WPM allows for a more detailed story.
-    total_words = target_minutes * 150
+    total_words = target_minutes * WORDS_PER_MINUTE
     
     # Enforce strictly 5-minute chapters (650 words each).
     # 10 min = 2 chapters, 15 min = 3 chapters, 20 min = 4 chapters
@@ -675,7 +664,8 @@ Antworte NUR im validen JSON-Format. WICHTIG: Entwerte (escape) alle Anführungs
             "plot_action": "Was in diesem Teil im Vergleich zum Original geändert oder beibehalten wird...",
             "setting": "Ort der Handlung...",
             "emotional_shift": "Emotionale Entwicklung...",
-            "ending_note": "Wie dieser Abschnitt endet..."
+            "ending_note": "Wie dieser Abschnitt endet...",
+            "end_state": "Ein Satz: Wo und in welcher Lage die Figuren am Ende dieses Abschnitts stehen..."
         }},
         ...
     ]
@@ -702,7 +692,8 @@ Antworte NUR im validen JSON-Format. WICHTIG: Entwerte (escape) alle Anführungs
             "plot_action": "Was konkret physisch passiert...",
             "setting": "Der Ort der Handlung...",
             "emotional_shift": "Die emotionale Entwicklung oder Stimmung...",
-            "ending_note": "Wie dieser Abschnitt endet (z.B. Cliffhanger, ruhiger Ausklang)..."
+            "ending_note": "Wie dieser Abschnitt endet (z.B. Cliffhanger, ruhiger Ausklang)...",
+            "end_state": "Ein Satz: Wo und in welcher Lage die Figuren am Ende dieses Abschnitts stehen..."
         }},
         ...
     ]
@@ -722,39 +713,13 @@ Antworte NUR im validen JSON-Format. WICHTIG: Entwerte (escape) alle Anführungs
             prompt=outline_prompt,
             model=text_model,
             temperature=0.8,
-            max_tokens=8192,
-            response_mime_type="application/json"
+            max_tokens=_outline_token_budget(num_segments),
+            response_mime_type="application/json",
+            response_schema=OutlineSchema
         )
         rate_limiter.increment_daily_quota("text")
         
-        text = response_text.strip()
-        
-        # Robust JSON extraction: Find the first { and the last }
-        json_match = re.search(r'\{.*\}', text, re.DOTALL)
-        if json_match:
-            text = json_match.group(0)
-        else:
-            if text.startswith("```json"):
-                text = text.replace("```json", "", 1).replace("```", "", 1).strip()
-            elif text.startswith("```"):
-                text = text.replace("```", "", 2).strip()
-                
-        try:
-            outline_data = json.loads(text)
-        except Exception as json_err:
-            logger.warning(f"Initial JSON parse failed: {json_err}. Attempting aggressive cleanup...")
-            # Aggressive cleanup for unescaped quotes
-            # This is a heuristic: try to find common patterns like "key": "value with "quotes" inside"
-            # But simpler: just try to use a more forgiving parser logic if we had one.
-            # For now, let's just try to fix common trailing commas and unescaped quotes.
-            text = re.sub(r',\s*\}', '}', text)
-            text = re.sub(r',\s*\]', ']', text)
-            try:
-                outline_data = json.loads(text)
-            except:
-                # If it still fails, let's try one more thing: 
-                # Replace "plot_action": "..." with something safer if we can find it
-                raise json_err
+        outline_data = _parse_llm_json(response_text.strip())
 
         title = outline_data.get("title", "Eine neue Geschichte")
         synopsis = outline_data.get("synopsis", "Kurzgeschichte")
@@ -763,10 +728,9 @@ Antworte NUR im validen JSON-Format. WICHTIG: Entwerte (escape) alle Anführungs
         if on_progress:
             await on_progress("outline_done", "Planung abgeschlossen", 5, title=title, synopsis=synopsis)
     except Exception as e:
-        import logging
-        logging.error(f"Multi-pass outline failure: {e}")
+        logger.error(f"Multi-pass outline failure: {e}")
         try:
-            logging.error(f"Raw Outline LLM Output was: {outline_res.text}")
+            logger.error(f"Raw Outline LLM Output was: {outline_res.text}")
         except:
             pass
         # Graceful fallback to single-pass if outline fails
@@ -782,27 +746,14 @@ Antworte NUR im validen JSON-Format. WICHTIG: Entwerte (escape) alle Anführungs
             multi_voice=multi_voice, supports_emotions=supports_emotions
         )
     
-    full_chapters = []
-    
-    # Step 2: Iterative Writing
-    for i, seg in enumerate(segments):
-        if on_progress:
-            pct = 5 + int((i / num_segments) * 25) # Up to 30%
-            await on_progress("text_chapter_done", f"Teil {i+1}/{num_segments} geschrieben", pct)
-            
-        # Context is the entire story text generated so far to maintain consistency
-        if full_chapters:
-            previous_text = "\n\n".join([c['text'] for c in full_chapters])
-            context = f"Bisheriger Verlauf der Geschichte:\n{previous_text}"
-        else:
-            context = "Dies ist der Beginn der Geschichte."
-        
+    # Step 2: Chapter Writing
+    async def write_chapter(i, seg, context):
         is_last_chapter = (i == num_segments - 1)
         
         if is_last_chapter:
-            ende_regel = f"5. UMFANG & ENDE: Ziele auf ca. {words_per_segment} Wörter ab. DIES IST DAS FINALE KAPITEL! Führe die Geschichte zwingend zu einem runden, atmosphärischen Abschluss. Schließe die Handlung ab. Kein Cliffhanger mehr!"
+            ende_regel = f"UMFANG & ENDE: Ziele auf ca. {words_per_segment} Wörter ab. DIES IST DAS FINALE KAPITEL! Führe die Geschichte zwingend zu einem runden, atmosphärischen Abschluss. Schließe die Handlung ab. Kein Cliffhanger mehr!"
         else:
-            ende_regel = f"5. UMFANG & ENDE: Ziele auf ca. {words_per_segment} Wörter ab. WICHTIG: Beende das Kapitel NIEMALS mitten in einem Satz. Führe die Szene logisch zu Ende oder erzeuge einen weichen Übergang/Cliffhanger."
+            ende_regel = f"UMFANG & ENDE: Ziele auf ca. {words_per_segment} Wörter ab. WICHTIG: Beende das Kapitel NIEMALS mitten in einem Satz. Führe die Szene logisch zu Ende oder erzeuge einen weichen Übergang/Cliffhanger."
         
         # For improvements/remixes, provide the original chapter text as context
         original_segment_context = ""
@@ -814,7 +765,7 @@ Antworte NUR im validen JSON-Format. WICHTIG: Entwerte (escape) alle Anführungs
         multi_voice_regel = ""
         if multi_voice:
             multi_voice_regel = (
-                "8. MEHRERE STIMMEN (SPEAKER-TAGS): Verwende für wörtliche Rede und Erzähltext die folgenden S2-Pro Sprecher-Tags:\n"
+                "9. MEHRERE STIMMEN (SPEAKER-TAGS): Verwende für wörtliche Rede und Erzähltext die folgenden S2-Pro Sprecher-Tags:\n"
                 "   - `<|speaker:0|>` für den Erzähler (Narrator)\n"
                 "   - `<|speaker:1|>` für den ersten sprechenden Hauptcharakter (z.B. der Protagonist)\n"
                 "   - `<|speaker:2|>` für den zweiten sprechenden Charakter\n"
@@ -824,40 +775,36 @@ Antworte NUR im validen JSON-Format. WICHTIG: Entwerte (escape) alle Anführungs
         emotion_regel = ""
         if supports_emotions:
             emotion_regel = (
-                "9. EMOTIONS-TAGS: Du kannst emotionale Ausdrücke direkt in den Text einbetten. Füge dazu englische Tags in eckigen Klammern am Anfang eines Satzes oder vor wörtlicher Rede ein.\n"
+                "10. EMOTIONS-TAGS: Du kannst emotionale Ausdrücke direkt in den Text einbetten. Füge dazu englische Tags in eckigen Klammern am Anfang eines Satzes oder vor wörtlicher Rede ein.\n"
                 "   Beispiele: [whispering], [laughing], [sighing], [excited], [sad], [angry], [gasp], [yawn].\n"
                 "   Nutze diese äußerst sparsam (maximal 1-2 Mal pro Kapitel) und nur dort, wo es emotional wirklich passt."
             )
 
-        write_prompt = f"""Schreibe das nächste chronologische Kapitel der Geschichte.
- 
-STRIKTE REGELN:
-1. NATÜRLICHER RHYTHMUS: Achte auf einen abwechslungsreichen Satzbau. Nutze sowohl kurze, prägnante Aussagen als auch elegante Nebensätze, um einen flüssigen Leserythmus zu erzeugen. Ideal für Audio/TTS, um Monotonie zu vermeiden. Vermeide jedoch extrem überladene Schachtelsätze.
-2. Stil-Inspiration:
-{selected_style_info}
-{kids_prompt}
-Vermeide jegliche Floskeln, pädagogische Zeigefinger oder moralische Zusammenfassungen am Ende. Kein Kitsch, keine Moral!
-3. Show, don't tell: Erkläre nicht, wie sich Charaktere fühlen – zeige es durch ihre Handlungen und Reaktionen.
-4. Pacing & Detail: Beschreibe präzise und atmosphärisch. Behandle diesen Abschnitt mit der Tiefe eines Romans. Springe nicht zu schnell in der Handlung voran.
-5. VERMEIDE ÜBEREILTE ENDEN: Hetze nicht zum Schluss. Vermeide Floskeln wie "Und so lernten sie..." oder "Am Ende war alles...". Bleib im Moment der Szene.
-6. Format: Keinerlei Überschriften, Kapitelnummern oder Titel im generierten Text! Nur der reine, fließende Erzähltext.
-7. FORTSCHRITT STATT WIEDERHOLUNG: Wiederhole niemals Phrasen, Metaphern oder innere Monologe aus den vorherigen Kapiteln. Fasse das Bisherige nicht zusammen. Die Handlung MUSS aktiv voranschreiten. Bringe ununterbrochen neue, frische Details ein.
-8. KEIN MARKDOWN: Benutze unter keinen Umständen Markdown-Sternchen (*) oder Unterstriche (_), um Gedanken, Betonungen oder wörtliche Rede hervorzuheben. Nutze für wörtliche Rede stattdessen klassische deutsche Anführungszeichen (z. B. „...“ oder »...«).
+        # Ordered from most to least stable (fixed rules, story-wide settings, story so far,
+        # this chapter) so consecutive chapter calls share a long prompt prefix that Gemini
+        # can serve from its implicit cache
+        write_prompt = f"""{CHAPTER_INSTRUCTIONS_PREFIX}
 {multi_voice_regel}
 {emotion_regel}
+
+Stil-Inspiration:
+{selected_style_info}
+{kids_prompt}
 {f"SPEZIELLE REMIX-ANWEISUNG: {further_instructions}" if further_instructions else ""}
-{original_segment_context}
-{ende_regel}
 
 Rahmenbedingungen:
 Titel der Gesamtgeschichte: {title}
 Zusammenfassung der Geschichte: {synopsis}
+
+{context}
+
+{original_segment_context}
 Vorgaben für DIESES Kapitel:
 - Kernhandlung (Plot): {seg.get('plot_action', seg.get('goal', ''))}
 - Ort (Setting): {seg.get('setting', 'Aus dem Kontext ableiten')}
 - Emotionale Entwicklung: {seg.get('emotional_shift', 'Neutral')}
 - Ziel für das Kapitelende: {seg.get('ending_note', 'Logisch abschließen')}
-{context}
+{ende_regel}
 """
         if not rate_limiter.has_daily_quota("text"):
             raise RuntimeError("Das Tageslimit für KI-Generierungen wurde während der Geschichte erreicht.")
@@ -870,17 +817,79 @@ Vorgaben für DIESES Kapitel:
             prompt=write_prompt,
             model=text_model,
             temperature=0.8,
-            max_tokens=8192,
+            max_tokens=_chapter_token_budget(words_per_segment),
             presence_penalty=0.1,
             frequency_penalty=0.3
         )
         rate_limiter.increment_daily_quota()
-        segment_text = response_text.strip().replace("*", "")
-        
-        full_chapters.append({
-            "title": "",
-            "text": segment_text
-        })
+        return response_text.strip().replace("*", "")
+
+    parts: list[str] = []
+    if settings.PARALLEL_CHAPTERS:
+        # Every chapter is anchored on the outline handoff of its predecessor instead of
+        # the full previous text, so all chapters can be written concurrently.
+        semaphore = asyncio.Semaphore(settings.GEMINI_CONCURRENCY)
+        finished = 0
+        # The same arc overview goes to every chapter so they all write towards one story
+        story_arc = "\n".join(
+            f"Kapitel {n}: {seg.get('plot_action', seg.get('goal', ''))}"
+            for n, seg in enumerate(segments, 1)
+        )
+        arc_context = f"Handlungsbogen der gesamten Geschichte (nur zur Orientierung):\n{story_arc}"
+
+        async def write_from_outline(i, seg):
+            nonlocal finished
+            if i == 0:
+                context = f"{arc_context}\n\nDies ist der Beginn der Geschichte."
+            else:
+                prev = segments[i - 1]
+                handoff = prev.get("end_state") or prev.get("ending_note", "")
+                context = f"{arc_context}\n\nDas vorherige Kapitel endet so:\n{handoff}\nKnüpfe nahtlos daran an."
+            async with semaphore:
+                await rate_limiter.wait_for_capacity("text")
+                segment_text = await write_chapter(i, seg, context)
+            if on_chapter:
+                await on_chapter(i, segment_text)
+            finished += 1
+            if on_progress:
+                pct = 5 + int((finished / num_segments) * 25) # Up to 30%
+                await on_progress("text_chapter_done", f"Teil {finished}/{num_segments} geschrieben", pct)
+            return segment_text
+
+        tasks = [asyncio.create_task(write_from_outline(i, seg)) for i, seg in enumerate(segments)]
+        try:
+            parts = list(await asyncio.gather(*tasks))
+        except BaseException:
+            # One failed chapter fails the story: stop the other chapter calls (and with them any
+            # further on_chapter TTS starts) before the error reaches the pipeline
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+    else:
+        # Context is the story text generated so far to maintain consistency. It is kept as a
+        # running tail (the whole text unless STORY_CONTEXT_CHARS caps it) so no iteration
+        # has to re-join all previous chapters.
+        tail_limit = settings.STORY_CONTEXT_CHARS
+        tail = ""
+        for i, seg in enumerate(segments):
+            if on_progress:
+                pct = 5 + int((i / num_segments) * 25) # Up to 30%
+                await on_progress("text_chapter_done", f"Teil {i+1}/{num_segments} geschrieben", pct)
+
+            if tail:
+                context = f"Bisheriger Verlauf der Geschichte:\n{tail}"
+            else:
+                context = "Dies ist der Beginn der Geschichte."
+            segment_text = await write_chapter(i, seg, context)
+            parts.append(segment_text)
+            if on_chapter:
+                await on_chapter(i, segment_text)
+            tail = f"{tail}\n\n{segment_text}" if tail else segment_text
+            if tail_limit and len(tail) > tail_limit:
+                tail = tail[-tail_limit:]
+
+    full_chapters = [{"title": "", "text": segment_text} for segment_text in parts]
 
     return {
         "title": title,
@@ -923,19 +932,7 @@ Antworte EXKLUSIV im JSON-Format:
         )
         rate_limiter.increment_daily_quota("text")
         
-        text = response_text.strip()
-        
-        # Robust JSON extraction
-        json_match = re.search(r'\{.*\}', text, re.DOTALL)
-        if json_match:
-            text = json_match.group(0)
-        else:
-            if text.startswith("```json"):
-                text = text.replace("```json", "", 1).replace("```", "", 1).strip()
-            elif text.startswith("```"):
-                text = text.replace("```", "", 2).strip()
-                
-        data = json.loads(text)
+        data = _parse_llm_json(response_text.strip())
         return {
             "synopsis": data.get("refined_synopsis", ""),
             "highlights": data.get("highlights", "")
@@ -1032,17 +1029,7 @@ GESCHICHTE (JSON-Format):
         )
         rate_limiter.increment_daily_quota("text")
         
-        text = response_text.strip()
-        json_match = re.search(r'\{.*\}', text, re.DOTALL)
-        if json_match:
-            text = json_match.group(0)
-        else:
-            if text.startswith("```json"):
-                text = text.replace("```json", "", 1).replace("```", "", 1).strip()
-            elif text.startswith("```"):
-                text = text.replace("```", "", 2).strip()
-                
-        output_data = json.loads(text)
+        output_data = _parse_llm_json(response_text.strip())
         
         if "chapters" in output_data and isinstance(output_data["chapters"], list):
             # Merge tagged text back into original story_data
@@ -1106,9 +1093,10 @@ async def extract_speakers_from_tagged_story(story_data: dict) -> list[dict]:
             speakers.sort(key=lambda s: s["id"])
             return speakers
 
-    full_text = ""
-    for idx, c in enumerate(story_data.get("chapters", [])):
-        full_text += f"\n\n--- Kapitel {idx + 1} ---\n{c.get('text', '')}"
+    full_text = "".join(
+        f"\n\n--- Kapitel {idx + 1} ---\n{c.get('text', '')}"
+        for idx, c in enumerate(story_data.get("chapters", []))
+    )
         
     prompt = f"""Du bist ein Hörspiel-Produzent. Analysiere den folgenden Text, der S2-Pro Sprecher-Tags (wie <|speaker:0|>, <|speaker:1|>, etc.) enthält.
 Identifiziere für jeden Sprecher-Tag die Person/Rolle in der Geschichte und bestimme ihr Geschlecht ('male' für männlich, 'female' für weiblich, 'neutral' für neutral/unbekannt/Tier/Gegenstand).
@@ -1137,12 +1125,7 @@ TEXT:
         )
         rate_limiter.increment_daily_quota("text")
         
-        text = response_text.strip()
-        json_match = re.search(r'\{.*\}', text, re.DOTALL)
-        if json_match:
-            text = json_match.group(0)
-            
-        data = json.loads(text)
+        data = _parse_llm_json(response_text.strip())
         return data.get("speakers", [])
     except Exception as e:
         logger.error(f"Failed to extract speakers: {e}", exc_info=True)
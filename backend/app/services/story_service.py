@@ -1,27 +1,118 @@
 import asyncio
-import json
 import logging
 import time
 import uuid
+from collections import OrderedDict
 from datetime import datetime, timezone
 from pathlib import Path
 
+import orjson
+
 from app.config import settings
 from app.models import StoryMeta, User
 from app.services.store import store
-from app.services.tts_service import get_available_voices, chapters_to_audio
-from app.services.story_generator import generate_full_story, get_author_names
-from app.services.image_generator import generate_story_image
-from app.services.audio_processor import merge_audio_files, get_audio_duration
 
 logger = logging.getLogger(__name__)
 
+class _StatusCache(OrderedDict):
+    """Bounded LRU for generation status; entries expire `ttl` seconds after being set."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 86400):
+        super().__init__()
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._set_at: dict[str, float] = {}
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        self._set_at[key] = time.monotonic()
+        self._evict()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._set_at.pop(key, None)
+
+    def _expire(self, key):
+        set_at = self._set_at.get(key)
+        if set_at is not None and time.monotonic() - set_at > self.ttl:
+            del self[key]
+
+    def __getitem__(self, key):
+        self._expire(key)
+        return super().__getitem__(key)
+
+    def __contains__(self, key):
+        self._expire(key)
+        return super().__contains__(key)
+
+    def get(self, key, default=None):
+        self._expire(key)
+        return super().get(key, default)
+
+    def _evict(self):
+        now = time.monotonic()
+        # Oldest entries sit at the front
+        while self:
+            oldest = next(iter(self))
+            if len(self) > self.maxsize or now - self._set_at.get(oldest, now) > self.ttl:
+                del self[oldest]
+            else:
+                break
+
+
 # Global state for in-memory status
-_generation_status: dict[str, dict] = {}
+_generation_status: _StatusCache = _StatusCache()
+
+# SSE subscribers per story; each receives a snapshot after every status change
+_status_listeners: dict[str, set[asyncio.Queue]] = {}
+
+
+def _notify_status(story_id: str):
+    """Push the current status snapshot to all SSE subscribers of a story."""
+    listeners = _status_listeners.get(story_id)
+    status = _generation_status.get(story_id)
+    if not listeners or status is None:
+        return
+    snapshot = dict(status)
+    for q in listeners:
+        q.put_nowait(snapshot)
+
+# Minimum seconds between progress writes to the store (the in-memory status is always current)
+STORE_FLUSH_INTERVAL = 0.5
 
 class StoryService:
     def get_status(self, story_id: str) -> dict | None:
-        return _generation_status.get(story_id)
+        status = _generation_status.get(story_id)
+        if status is not None:
+            return status
+
+        # Not generated by this process (other worker, restart, evicted):
+        # fall back to the progress the pipeline persists to the store.
+        story = store.get_by_id(story_id)
+        if not story:
+            return None
+        return {
+            "status": story.status,
+            "progress": story.progress,
+            "progress_pct": story.progress_pct,
+            "title": story.title,
+        }
+
+    def subscribe(self, story_id: str) -> asyncio.Queue | None:
+        """Register an SSE listener for a story that is generating in this process."""
+        if _generation_status.get(story_id) is None:
+            return None
+        q: asyncio.Queue = asyncio.Queue()
+        _status_listeners.setdefault(story_id, set()).add(q)
+        return q
+
+    def unsubscribe(self, story_id: str, q: asyncio.Queue):
+        listeners = _status_listeners.get(story_id)
+        if listeners:
+            listeners.discard(q)
+            if not listeners:
+                del _status_listeners[story_id]
 
     async def _generate_thumbnail(self, source: Path, dest: Path, size: int = 400):
         def _resize():
@@ -52,15 +143,13 @@ class StoryService:
         is_kids_book: bool = False,
     ) -> StoryMeta:
         """Synchronously create the initial story record and directory."""
+        from app.services.tts_service import get_voice_name
+        from app.services.story_generator import get_author_names
+
         story_dir = settings.AUDIO_OUTPUT_DIR / story_id
         story_dir.mkdir(parents=True, exist_ok=True)
 
-        voice_name = "Unbekannt"
-        all_voices = get_available_voices(user_id=user_id)
-        for v in all_voices:
-            if v["key"] == voice_key:
-                voice_name = v["name"]
-                break
+        voice_name = get_voice_name(voice_key)
 
         clean_prompt = original_prompt or prompt or ""
         if clean_prompt and "Kurzgeschichte im Genre" in clean_prompt and "Idee:" in clean_prompt:
@@ -94,6 +183,7 @@ class StoryService:
             "progress": "Starte Generierung...",
             "title": None,
         }
+        _notify_status(story_id)
         return story_meta
 
     async def run_pipeline(
@@ -118,6 +208,11 @@ class StoryService:
         is_kids_book: bool = False,
     ):
         """Full pipeline: text → TTS → merge → save."""
+        from app.services.tts_service import chapters_to_audio, generate_tts_chunk, GEMINI_VOICES
+        from app.services.story_generator import generate_full_story
+        from app.services.image_generator import generate_story_image
+        from app.services.audio_processor import merge_audio_files, get_audio_duration
+
         logger.info(f"!!! STARTING PIPELINE for story {story_id} (Alexa: {alexa_user_id}) !!!")
         
         # Initialize (idempotent, ensures record exists before we start background work)
@@ -146,6 +241,7 @@ class StoryService:
         completed_points = 0
         image_task = None
         image_url = None
+        last_store_flush = 0.0
 
         async def background_image_gen(synopsis_for_image: str):
             nonlocal image_url
@@ -155,15 +251,19 @@ class StoryService:
                 if res:
                     image_url = f"/api/stories/{story_id}/image.png"
                     await self._generate_thumbnail(image_path, story_dir / "cover_thumb.jpg")
-                    curr = store.get_by_id(story_id)
-                    if curr:
-                        curr.image_url = image_url
-                        store.add_story(curr)
+                    store.patch(story_id, image_url=image_url)
             except Exception as e:
                 logger.error(f"Image gen failed: {e}")
 
-        async def on_progress(status_type: str, message: str, points: int | None = None, is_absolute_points: bool = False, **kwargs):
-            nonlocal completed_points, image_task
+        async def await_cover():
+            # Cover generation runs concurrently with the text tail / TTS / merge;
+            # only join it right before the final write. A failure must not fail the story.
+            if image_task:
+                await asyncio.gather(image_task, return_exceptions=True)
+
+        async def on_progress(status_type: str, message: str, points: int | None = None, is_absolute_points: bool = False, store_fields: dict | None = None, **kwargs):
+            """Update in-memory status; `store_fields` are persisted in the same store write."""
+            nonlocal completed_points, image_task, last_store_flush
             logger.info(f"PIPELINE PROGRESS [{story_id}]: {status_type} - {message} (Points: {points})")
             if points is not None:
                 if is_absolute_points: completed_points = points
@@ -171,7 +271,7 @@ class StoryService:
             
             # Use total_points defensively to avoid zero division
             safe_total = max(total_points, 1)
-            pct = min(int((completed_points / safe_total) * 100), 99)
+            pct = 100 if status_type == "done" else min(int((completed_points / safe_total) * 100), 99)
             
             label = message
             if status_type == "generating_text": label = "Texterstellung"
@@ -185,27 +285,41 @@ class StoryService:
                 logger.info(f"PIPELINE [{story_id}]: Starting background image generation task.")
                 image_task = asyncio.create_task(background_image_gen(synopsis_val))
             
-            _generation_status[story_id].update({
+            # Written back (not updated in place) so every transition renews the TTL and LRU position
+            _generation_status[story_id] = {
+                **(_generation_status.get(story_id) or {}),
                 "status": status_type,
                 "progress": label,
                 "progress_pct": pct,
                 **kwargs
-            })
+            }
+            _notify_status(story_id)
+
+            # Throttle store writes; terminal states and title/synopsis changes always go through
+            now = time.monotonic()
+            is_terminal = status_type in ["done", "error"]
+            if not is_terminal and "title" not in kwargs and "synopsis" not in kwargs and now - last_store_flush < STORE_FLUSH_INTERVAL:
+                return
+            last_store_flush = now
 
             try:
-                curr = store.get_by_id(story_id)
-                if curr:
-                    curr.status = "generating" if status_type not in ["done", "error"] else status_type
-                    curr.progress = label
-                    curr.progress_pct = pct
-                    if "title" in kwargs: curr.title = kwargs.get("title")
-                    if "synopsis" in kwargs: curr.description = kwargs.get("synopsis")
-                    store.add_story(curr)
-                else:
+                fields = {
+                    "status": "generating" if not is_terminal else status_type,
+                    "progress": label,
+                    "progress_pct": pct,
+                }
+                if "title" in kwargs: fields["title"] = kwargs.get("title")
+                if "synopsis" in kwargs: fields["description"] = kwargs.get("synopsis")
+                if store_fields: fields.update(store_fields)
+                if not store.patch(story_id, **fields):
                     logger.warning(f"PIPELINE [{story_id}]: Story object not found in store for progress update!")
             except Exception as e:
                 logger.error(f"PIPELINE [{story_id}]: Failed to update progress in store: {e}")
 
+        chunks_dir = story_dir / "chunks"
+        # Chapter TTS tasks started while the text is still being written
+        chapter_tts: dict[int, asyncio.Task] = {}
+
         try:
             start_time_total = time.time()
             logger.info(f"PIPELINE [{story_id}]: Pipeline execution started.")
@@ -228,6 +342,25 @@ class StoryService:
             # (e.g., to a Fish/x.ai voice) to automatically use the emotions.
             supports_emotions = True
 
+            # Per-chapter engines start voicing each chapter as soon as its text is final, so TTS
+            # overlaps with writing the remaining chapters. Gemini TTS re-chunks the whole story
+            # across chapter boundaries and therefore still starts after the text phase.
+            if voice_key != "none" and voice_key not in GEMINI_VOICES:
+                tts_semaphore = asyncio.Semaphore(settings.TTS_CONCURRENCY)
+
+                async def voice_chapter(index: int, text: str):
+                    async with tts_semaphore:
+                        return await generate_tts_chunk(
+                            text, chunks_dir / f"chapter_{index+1}.mp3", voice_key, speech_rate,
+                            genre=genre, multi_voice=multi_voice,
+                        )
+
+                async def start_chapter_tts(index: int, text: str):
+                    chunks_dir.mkdir(parents=True, exist_ok=True)
+                    chapter_tts[index] = asyncio.create_task(voice_chapter(index, text))
+            else:
+                start_chapter_tts = None
+
             story_data = await generate_full_story(
                 prompt=prompt,
                 genre=genre,
@@ -241,10 +374,17 @@ class StoryService:
                 multi_voice=multi_voice,
                 supports_emotions=supports_emotions,
                 is_kids_book=is_kids_book,
+                on_chapter=start_chapter_tts,
             )
             
             real_title = story_data["title"]
             real_num_chapters = len(story_data["chapters"])
+
+            # The cover is normally started at outline_done; if the outline carried no
+            # synopsis, start it now so it still overlaps with TTS and the audio merge.
+            if not image_task and story_data.get("synopsis"):
+                logger.info(f"PIPELINE [{story_id}]: Starting background image generation task after text phase.")
+                image_task = asyncio.create_task(background_image_gen(story_data["synopsis"]))
             
             # Recalculate total points
             total_points = 5 + (10 * real_num_chapters) + 5
@@ -253,23 +393,17 @@ class StoryService:
             await on_progress("generating_text", "Texterstellung", points=5 + (10 * real_num_chapters), is_absolute_points=True)
 
             text_path = story_dir / "story.json"
-            text_path.write_text(json.dumps(story_data, ensure_ascii=False, indent=2), encoding="utf-8")
+            await asyncio.to_thread(text_path.write_bytes, orjson.dumps(story_data))
 
             # Phase 4: Audio
             if voice_key == "none":
-                if image_task: await image_task
-                
-                curr = store.get_by_id(story_id)
-                if curr:
-                    curr.duration_seconds = 0
-                    curr.chapter_count = real_num_chapters
-                    curr.word_count = len("\n".join([c["text"] for c in story_data["chapters"]]).split())
-                    curr.status = "done"
-                    curr.progress = "Fertig!"
-                    curr.progress_pct = 100
-                    store.add_story(curr)
+                await await_cover()
                 
-                await on_progress("done", "Fertig!", points=total_points, is_absolute_points=True)
+                await on_progress("done", "Fertig!", points=total_points, is_absolute_points=True, store_fields={
+                    "duration_seconds": 0,
+                    "chapter_count": real_num_chapters,
+                    "word_count": sum(len(c["text"].split()) for c in story_data["chapters"]),
+                })
                 
                 if alexa_user_id and user_id:
                     added = store.add_to_playlist(user_id, story_id)
@@ -288,7 +422,6 @@ class StoryService:
                     chunk_points = int((completed / max(total, 1)) * 20 * real_num_chapters)
                     await on_progress("generating_audio", "Vertonung", points=5 + (10 * real_num_chapters) + 5 + chunk_points, is_absolute_points=True)
 
-            chunks_dir = story_dir / "chunks"
             audio_files, actual_voice = await chapters_to_audio(
                 chapters=story_data["chapters"],
                 output_dir=chunks_dir,
@@ -299,6 +432,7 @@ class StoryService:
                 synopsis=story_data.get("synopsis"),
                 title=story_data.get("title"),
                 multi_voice=multi_voice,
+                prerendered=chapter_tts,
             )
 
             await on_progress("processing", "Finalisierung", points=total_points - 10, is_absolute_points=True)
@@ -307,19 +441,13 @@ class StoryService:
             await merge_audio_files(audio_files, final_audio_path, settings.INTRO_MUSIC_PATH, settings.OUTRO_MUSIC_PATH)
 
             duration = await get_audio_duration(final_audio_path)
-            if image_task: await image_task
-
-            curr = store.get_by_id(story_id)
-            if curr:
-                curr.duration_seconds = duration
-                curr.chapter_count = real_num_chapters
-                curr.word_count = len("\n".join([c["text"] for c in story_data["chapters"]]).split())
-                curr.status = "done"
-                curr.progress = "Fertig!"
-                curr.progress_pct = 100
-                store.add_story(curr)
+            await await_cover()
 
-            await on_progress("done", "Fertig!", points=total_points, is_absolute_points=True)
+            await on_progress("done", "Fertig!", points=total_points, is_absolute_points=True, store_fields={
+                "duration_seconds": duration,
+                "chapter_count": real_num_chapters,
+                "word_count": sum(len(c["text"].split()) for c in story_data["chapters"]),
+            })
 
             if alexa_user_id and user_id:
                 added = store.add_to_playlist(user_id, story_id)
@@ -330,15 +458,17 @@ class StoryService:
             # BENCHMARK
             logger.info(f"BENCHMARK [{story_id}]: Total Pipeline Finished in {time.time() - start_time_total:.2f}s")
 
-
-            logger.info(f"BENCHMARK [{story_id}]: Total Pipeline Finished in {time.time() - start_time_total:.2f}s")
-
         except Exception as e:
             logger.error(f"Pipeline error for {story_id}: {e}", exc_info=True)
+            for task in chapter_tts.values():
+                task.cancel()
             await on_progress("error", f"Fehler: {str(e)}")
 
     async def run_revoice_pipeline(self, story_id: str, voice_key: str, speech_rate: str, multi_voice: bool = False, speaker_voices: dict[str, str] | None = None):
         """Revoice pipeline: load text → TTS → merge → save."""
+        from app.services.tts_service import get_voice_name, chapters_to_audio
+        from app.services.audio_processor import merge_audio_files, get_audio_duration
+
         story_dir = settings.AUDIO_OUTPUT_DIR / story_id
         text_path = story_dir / "story.json"
         
@@ -346,7 +476,7 @@ class StoryService:
             logger.error(f"Cannot revoice: {text_path} missing")
             return
 
-        story_data = json.loads(text_path.read_text(encoding="utf-8"))
+        story_data = orjson.loads(await asyncio.to_thread(text_path.read_bytes))
         
         # Check if the story already has speaker tags
         has_speaker_tags = any("<|speaker:" in c.get("text", "") for c in story_data.get("chapters", []))
@@ -359,55 +489,61 @@ class StoryService:
                 "progress": "Analysiere Geschichte...",
                 "title": story_data.get("title"),
             }
-            curr = store.get_by_id(story_id)
-            if curr:
-                curr.status = "generating"
-                curr.progress = "Analysiere Geschichte..."
-                store.add_story(curr)
+            _notify_status(story_id)
+            store.patch(story_id, status="generating", progress="Analysiere Geschichte...")
                 
             story_data = await inject_speaker_tags_to_story(story_data, supports_emotions=True)
-            text_path.write_text(json.dumps(story_data, ensure_ascii=False, indent=2), encoding="utf-8")
+            await asyncio.to_thread(text_path.write_bytes, orjson.dumps(story_data))
             
         num_chapters = len(story_data["chapters"])
         
         # Recalculate word count from existing story.json
-        total_text = "\n".join([c.get("text", "") for c in story_data.get("chapters", [])])
-        word_count = len(total_text.split())
+        word_count = sum(len(c.get("text", "").split()) for c in story_data.get("chapters", []))
 
         # Vertonung: 10 * num_chapters
         # Finalisierung: 10
         total_points = (10 * num_chapters) + 10
         completed_points = 0
+        last_store_flush = 0.0
 
         _generation_status[story_id] = {
             "status": "starting",
             "progress": "Starte Neuvertonung...",
             "title": story_data.get("title"),
         }
+        _notify_status(story_id)
 
-        async def on_progress(status_type: str, message: str, points: int | None = None, is_absolute_points: bool = False):
-            nonlocal completed_points
+        async def on_progress(status_type: str, message: str, points: int | None = None, is_absolute_points: bool = False, store_fields: dict | None = None):
+            nonlocal completed_points, last_store_flush
             if points is not None:
                 if is_absolute_points: completed_points = points
                 else: completed_points += points
             
-            pct = min(int((completed_points / total_points) * 100), 99)
+            pct = 100 if status_type == "done" else min(int((completed_points / total_points) * 100), 99)
             label = message
             if status_type in ["generating_audio", "tts"]: label = "Vertonung"
             elif status_type == "processing": label = "Finalisierung"
 
-            _generation_status[story_id].update({
+            _generation_status[story_id] = {
+                **(_generation_status.get(story_id) or {}),
                 "status": status_type,
                 "progress": label,
                 "progress_pct": pct
-            })
+            }
+            _notify_status(story_id)
+
+            now = time.monotonic()
+            if status_type not in ["done", "error"] and now - last_store_flush < STORE_FLUSH_INTERVAL:
+                return
+            last_store_flush = now
             
-            curr = store.get_by_id(story_id)
-            if curr:
-                curr.status = "generating" if status_type not in ["done", "error"] else status_type
-                curr.progress = label
-                curr.progress_pct = pct
-                store.add_story(curr)
+            store.patch(
+                story_id,
+                status="generating" if status_type not in ["done", "error"] else status_type,
+                progress=label,
+                progress_pct=pct,
+                **(store_fields or {}),
+            )
 
         async def tts_progress_wrapper(stype, msg, extra_data=None):
             if stype == "tts_chunk_done" and extra_data:
@@ -444,23 +580,16 @@ class StoryService:
             await merge_audio_files(audio_files, final_audio_path, settings.INTRO_MUSIC_PATH, settings.OUTRO_MUSIC_PATH)
 
             duration = await get_audio_duration(final_audio_path)
-            curr = store.get_by_id(story_id)
-            all_voices = get_available_voices(user_id=curr.user_id if curr else None)
-            actual_voice_name = next((v["name"] for v in all_voices if v["key"] == actual_voice), "Unbekannt")
-
-            await on_progress("done", "Fertig!", points=total_points, is_absolute_points=True)
-
-            if curr:
-                curr.duration_seconds = duration
-                curr.voice_key = actual_voice
-                curr.voice_name = actual_voice_name
-                curr.word_count = word_count
-                curr.chapter_count = num_chapters
-                curr.status = "done"
-                curr.progress = "Fertig!"
-                curr.progress_pct = 100
-                curr.multi_voice = multi_voice
-                store.add_story(curr)
+            actual_voice_name = get_voice_name(actual_voice)
+
+            await on_progress("done", "Fertig!", points=total_points, is_absolute_points=True, store_fields={
+                "duration_seconds": duration,
+                "voice_key": actual_voice,
+                "voice_name": actual_voice_name,
+                "word_count": word_count,
+                "chapter_count": num_chapters,
+                "multi_voice": multi_voice,
+            })
 
         except Exception as e:
             logger.error(f"Revoice error for {story_id}: {e}", exc_info=True)
@@ -8,8 +8,15 @@ from app.config import settings
 
 logger = logging.getLogger(__name__)
 
-# Initialize Gemini Client
-gemini_client = genai.Client(api_key=settings.GEMINI_API_KEY)
+# Gemini client, created on first use so imports stay cheap
+_gemini_client = None
+
+
+def get_gemini_client():
+    global _gemini_client
+    if _gemini_client is None:
+        _gemini_client = genai.Client(api_key=settings.GEMINI_API_KEY)
+    return _gemini_client
 
 # Safety settings for Gemini
 SAFETY_SETTINGS_CONFIG = [
@@ -19,6 +26,9 @@ SAFETY_SETTINGS_CONFIG = [
     types.SafetySetting(category="HARM_CATEGORY_HARASSMENT", threshold="BLOCK_NONE"),
 ]
 
+# Creative calls vary on purpose; only (near-)deterministic ones are cached by default
+CACHE_MAX_TEMPERATURE = 0.1
+
 async def generate_text(
     prompt: str | list, 
     model: str = None, 
@@ -28,16 +38,42 @@ async def generate_text(
     system_instruction: str = None,
     response_schema: dict = None,
     presence_penalty: float = 0.0,
-    frequency_penalty: float = 0.0
+    frequency_penalty: float = 0.0,
+    cache: bool = False
 ) -> str:
     """
     Unified text generation function supporting Gemini and DeepSeek.
+    Near-deterministic calls (or cache=True) are answered from the on-disk LLM cache when possible;
+    identical concurrent requests are deduplicated either way.
     """
     if not model:
         model = settings.GEMINI_TEXT_MODEL
     
     logger.info(f"TEXT_GEN: Using model {model} (Temp: {temperature}, MIME: {response_mime_type})")
 
+    args = (prompt, model, temperature, max_tokens, response_mime_type, system_instruction, response_schema, presence_penalty, frequency_penalty)
+    if not isinstance(prompt, str):
+        return await _route_text(*args)
+
+    from app.services.llm_cache import cached_call, single_flight
+    schema = response_schema.model_json_schema() if hasattr(response_schema, "model_json_schema") else response_schema
+    payload = {
+        "prompt": prompt,
+        "model": model,
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+        "response_mime_type": response_mime_type,
+        "system_instruction": system_instruction,
+        "response_schema": schema,
+        "presence_penalty": presence_penalty,
+        "frequency_penalty": frequency_penalty,
+    }
+    if cache or temperature <= CACHE_MAX_TEMPERATURE:
+        return await cached_call(payload, lambda: _route_text(*args))
+    # Not cached, but identical requests running at the same time still share one call
+    return await single_flight(payload, lambda: _route_text(*args))
+
+async def _route_text(prompt, model, temperature, max_tokens, response_mime_type, system_instruction, response_schema, presence_penalty, frequency_penalty):
     if model.startswith("gemini"):
         return await _generate_gemini(prompt, model, temperature, max_tokens, response_mime_type, system_instruction, response_schema, presence_penalty, frequency_penalty)
     elif model.startswith("deepseek"):
@@ -68,9 +104,8 @@ async def _generate_gemini(prompt, model, temperature, max_tokens, response_mime
         # If it's a string, we wrap it in a list as the SDK expects
         formatted_contents = prompt if isinstance(prompt, list) else [prompt]
 
-        # Using to_thread because the SDK might be blocking
-        response = await asyncio.to_thread(
-            gemini_client.models.generate_content,
+        # Native async API: the request is awaited on the loop instead of parking a thread
+        response = await get_gemini_client().aio.models.generate_content(
             model=model,
             contents=formatted_contents,
             config=config
@@ -6,6 +6,9 @@ Generates MP3 chunks per chapter.
 import edge_tts
 import random
 import asyncio
+import logging
+import os
+import shutil
 from pathlib import Path
 from app.config import settings
 from app.services.rate_limiter import rate_limiter
@@ -13,6 +16,8 @@ from sqlmodel import Session, select
 from app.database import engine as db_engine
 from app.models import User
 
+logger = logging.getLogger(__name__)
+
 # Available Edge TTS German voices (Simplified)
 EDGE_VOICES = {
     "seraphina": {"id": "de-DE-SeraphinaMultilingualNeural", "name": "Seraphina", "gender": "female", "description": "Warm & melodisch"},
@@ -25,6 +30,9 @@ EDGE_VOICES = {
 #     "percy": {"id": "de-DE-Neural2-H", "name": "Percy", "gender": "male"},
 # }
 
+# OpenAI's speech endpoint accepts up to 4096 characters per request
+OPENAI_TTS_MAX_CHARS = 4000
+
 # OpenAI TTS voices
 OPENAI_VOICES = {
     # "shimmer": {"id": "shimmer", "name": "Shimmer", "gender": "female"},
@@ -126,6 +134,9 @@ GENRE_INSTRUCTIONS = {
 
 
 
+# Markdown characters removed from all text before synthesis (one pass instead of chained replaces)
+_MD_STRIP_TABLE = str.maketrans("", "", "*_#")
+
 # ── Text Chunking for Gemini TTS ──
 MIN_CHUNK_BYTES = 700
 MAX_CHUNK_BYTES = 1000
@@ -179,8 +190,74 @@ def split_text_paragraphs(t: str, min_bytes=MIN_CHUNK_BYTES, max_bytes=MAX_CHUNK
     return chunks
 
 
+# ── Text Chunking for Edge TTS ──
+# Long chapters are voiced as parallel segments of about this many words
+EDGE_SEGMENT_WORDS = 200
+
+def split_text_words(t: str, max_words: int = EDGE_SEGMENT_WORDS) -> list[str]:
+    """Greedily pack paragraphs (or sentences of overlong paragraphs) into chunks of ≤ max_words."""
+    chunks: list[str] = []
+    current: list[str] = []
+    current_words = 0
+
+    def add(piece: str, sep: str):
+        nonlocal current_words
+        words = len(piece.split())
+        if current and current_words + words > max_words:
+            chunks.append(sep.join(current))
+            current.clear()
+            current_words = 0
+        current.append(piece)
+        current_words += words
+
+    for p in (p.strip() for p in t.replace("\r\n", "\n").split("\n\n")):
+        if not p:
+            continue
+        if len(p.split()) <= max_words:
+            add(p, "\n\n")
+            continue
+        # Never cut inside a sentence, even when a paragraph is too long on its own
+        if current:
+            chunks.append("\n\n".join(current))
+            current.clear()
+            current_words = 0
+        for sentence in re.split(r"(?<=[.!?])\s+", p):
+            add(sentence, " ")
+        chunks.append(" ".join(current))
+        current.clear()
+        current_words = 0
+
+    if current:
+        chunks.append("\n\n".join(current))
+    return chunks
+
+
 DEFAULT_VOICE = "seraphina"
 
+# Hardcoded voices that take precedence over DB voices: voice_key -> (engine, voice_config).
+# Merged lowest priority first, so on a key collision OpenAI wins over xAI over Fish.
+# Gemini and Edge keys are only resolved after the DB lookups and are not part of it.
+STATIC_VOICE_REGISTRY: dict[str, tuple[str, dict]] = (
+    {k: ("fish", v) for k, v in FISH_VOICES.items()}
+    | {k: ("xai", v) for k, v in XAI_VOICES.items()}
+    | {k: ("openai", v) for k, v in OPENAI_VOICES.items()}
+)
+
+# Static parts of the voice list (read-only: callers copy before annotating)
+_FALLBACK_VOICES = tuple(
+    {"key": key, "name": v["name"], "gender": v["gender"], "engine": engine_name}
+    for voices, engine_name in ((EDGE_VOICES, "edge"), (GEMINI_VOICES, "gemini"), (FISH_VOICES, "fish"))
+    for key, v in voices.items()
+)
+_VIRTUAL_VOICES = (
+    {
+        "key": "none",
+        "name": "Keine Stimme (nur Text)",
+        "gender": "neutral",
+        "engine": "virtual",
+    },
+)
+
 
 def get_available_voices(user_id: str | None = None) -> list[dict]:
     """Return list of available voice profiles from the database."""
@@ -210,9 +287,10 @@ def get_available_voices(user_id: str | None = None) -> list[dict]:
                 clones_query = select(UserVoice).where(or_(UserVoice.is_public == True, UserVoice.user_id == user_id))
             
             db_voices = db_session.exec(clones_query).all()
+            seen_keys = {vox["key"] for vox in voices}
             for v_obj in db_voices:
                 # Avoid duplicates
-                if any(vox["key"] == v_obj.id for vox in voices):
+                if v_obj.id in seen_keys:
                     continue
                 voices.append({
                     "key": v_obj.id,
@@ -227,27 +305,37 @@ def get_available_voices(user_id: str | None = None) -> list[dict]:
             raise Exception("No voices found in DB, using fallback")
 
     except Exception as e:
-        import logging
-        logging.getLogger(__name__).warning(f"Using hardcoded voice fallback: {e}")
+        logger.warning(f"Using hardcoded voice fallback: {e}")
         # Fallback to hardcoded lists if DB fails or is empty
-        for key, v in EDGE_VOICES.items():
-            voices.append({"key": key, "name": v["name"], "gender": v["gender"], "engine": "edge"})
-        for key, v in GEMINI_VOICES.items():
-            voices.append({"key": key, "name": v["name"], "gender": v["gender"], "engine": "gemini"})
-        for key, v in FISH_VOICES.items():
-            voices.append({"key": key, "name": v["name"], "gender": v["gender"], "engine": "fish"})
+        voices.extend(_FALLBACK_VOICES)
 
     # Virtual Voices (like 'none')
-    voices.append({
-        "key": "none",
-        "name": "Keine Stimme (nur Text)",
-        "gender": "neutral",
-        "engine": "virtual",
-    })
+    voices.extend(_VIRTUAL_VOICES)
 
     return voices
 
 
+def get_voice_name(voice_key: str) -> str:
+    """Resolve a voice key to its display name without building the full voice list."""
+    if voice_key == "none":
+        return "Keine Stimme (nur Text)"
+
+    try:
+        from app.models import UserVoice, SystemVoice
+
+        with Session(db_engine) as db_session:
+            voice = db_session.get(SystemVoice, voice_key) or db_session.get(UserVoice, voice_key)
+            if voice:
+                return voice.name
+    except Exception as e:
+        logger.warning(f"Voice name lookup failed for {voice_key}: {e}")
+
+    for voices in (EDGE_VOICES, GEMINI_VOICES, FISH_VOICES):
+        if voice_key in voices:
+            return voices[voice_key]["name"]
+    return "Unbekannt"
+
+
 import re
 
 def strip_emotion_tags(text: str) -> str:
@@ -281,8 +369,7 @@ def get_fish_voice_id(voice_key: str, user_id: str | None = None) -> str:
             if sys_voice and sys_voice.fish_voice_id:
                 return sys_voice.fish_voice_id
     except Exception as e:
-        import logging
-        logging.getLogger(__name__).error(f"Error resolving Fish ID: {e}")
+        logger.error(f"Error resolving Fish ID: {e}")
     return voice_key
 
 def get_multi_voice_refs(primary_voice_key: str, text: str, user_id: str | None = None, speaker_voices: dict[str, str] | None = None) -> list[str]:
@@ -345,11 +432,30 @@ def get_fish_semaphore():
     return _fish_semaphore
 
 
+_http_client = None
+
+def get_http_client():
+    """Shared AsyncClient for the HTTP TTS engines, so chunks reuse pooled TLS connections."""
+    global _http_client
+    if _http_client is None:
+        import httpx
+        _http_client = httpx.AsyncClient(
+            timeout=120.0,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=16),
+        )
+    return _http_client
+
+
+async def close_http_client():
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
 async def generate_fish_audio(text: str, output_path: Path, reference_ids: list[str], use_s2_pro: bool = False):
     """Generate audio using Fish Audio API directly via httpx with retry and rate limiting."""
     import httpx
-    import logging
-    logger = logging.getLogger(__name__)
 
     headers = {
         "Authorization": f"Bearer {settings.FISH_API_KEY.strip()}",
@@ -373,35 +479,35 @@ async def generate_fish_audio(text: str, output_path: Path, reference_ids: list[
     async with get_fish_semaphore():
         for attempt in range(max_retries):
             try:
-                async with httpx.AsyncClient(timeout=120.0) as client:
-                    async with client.stream("POST", "https://api.fish.audio/v1/tts", headers=headers, json=payload) as response:
-                        if response.status_code == 429:
-                            delay = base_delay * (2 ** attempt)
-                            logger.warning(f"Fish API returned 429 Too Many Requests. Retrying in {delay:.1f}s (Attempt {attempt + 1}/{max_retries})...")
-                            await asyncio.sleep(delay)
-                            continue
+                client = get_http_client()
+                async with client.stream("POST", "https://api.fish.audio/v1/tts", headers=headers, json=payload) as response:
+                    if response.status_code == 429:
+                        delay = base_delay * (2 ** attempt)
+                        logger.warning(f"Fish API returned 429 Too Many Requests. Retrying in {delay:.1f}s (Attempt {attempt + 1}/{max_retries})...")
+                        await asyncio.sleep(delay)
+                        continue
 
+                    try:
+                        response.raise_for_status()
+                    except httpx.HTTPStatusError as e:
                         try:
-                            response.raise_for_status()
-                        except httpx.HTTPStatusError as e:
-                            try:
-                                err_body = await response.aread()
-                                logger.error(f"Fish API Error Details: {err_body.decode('utf-8', errors='ignore')}")
-                            except Exception:
-                                pass
-                            
-                            if attempt == max_retries - 1:
-                                raise e
-                            
-                            delay = base_delay * (2 ** attempt)
-                            logger.warning(f"Fish API error: {e}. Retrying in {delay:.1f}s...")
-                            await asyncio.sleep(delay)
-                            continue
-
-                        with open(output_path, "wb") as f:
-                            async for chunk in response.aiter_bytes():
-                                f.write(chunk)
-                        return # Success
+                            err_body = await response.aread()
+                            logger.error(f"Fish API Error Details: {err_body.decode('utf-8', errors='ignore')}")
+                        except Exception:
+                            pass
+                        
+                        if attempt == max_retries - 1:
+                            raise e
+                        
+                        delay = base_delay * (2 ** attempt)
+                        logger.warning(f"Fish API error: {e}. Retrying in {delay:.1f}s...")
+                        await asyncio.sleep(delay)
+                        continue
+
+                    with open(output_path, "wb") as f:
+                        async for chunk in response.aiter_bytes():
+                            f.write(chunk)
+                    return # Success
             except Exception as e:
                 if attempt == max_retries - 1:
                     raise e
@@ -411,36 +517,45 @@ async def generate_fish_audio(text: str, output_path: Path, reference_ids: list[
 
 
 
-async def generate_tts_chunk(
-    text: str,
-    output_path: Path,
-    voice_key: str = DEFAULT_VOICE,
-    rate: str = "0%",
-    is_title: bool = False,
-    genre: str | None = None,
-    previous_text: str | None = None,
-    on_chunk_progress: callable = None,
-    direct_fish_id: str | None = None,
-    multi_voice: bool = False,
-    speaker_voices: dict[str, str] | None = None,
-) -> tuple[Path, str]:
-    """
-    Convert text to speech and save as MP3.
-    Supports Edge TTS, Google Cloud TTS, and OpenAI TTS.
-    """
-    import logging
-    logger = logging.getLogger(__name__)
+# ──────────────────────────────────────────────
+# TTS result cache
+# ──────────────────────────────────────────────
+
+TTS_CACHE_DIR = settings.AUDIO_OUTPUT_DIR / "tts_cache"
 
+
+def _tts_cache_key(*parts) -> str:
+    import hashlib
+    import orjson
+    return hashlib.sha256(orjson.dumps(parts, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+def _tts_cache_fetch(key: str, output_path: Path) -> bool:
+    cached = TTS_CACHE_DIR / f"{key}.mp3"
+    try:
+        # Copies rather than hardlinks: later pipeline steps may rewrite output_path in place
+        shutil.copyfile(cached, output_path)
+    except FileNotFoundError:
+        return False
+    os.utime(cached)
+    return True
+
+
+def _tts_cache_store(key: str, output_path: Path):
+    from app.services.llm_cache import evict_oldest
+    TTS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    cached = TTS_CACHE_DIR / f"{key}.mp3"
+    tmp = cached.with_suffix(".tmp")
+    shutil.copyfile(output_path, tmp)
+    os.replace(tmp, cached)
+    evict_oldest(TTS_CACHE_DIR, settings.TTS_CACHE_MAX_MB * 1024 * 1024, ".mp3")
+
+
+def _resolve_voice(voice_key: str, direct_fish_id: str | None = None) -> tuple[str, dict]:
+    """Resolve voice_key to (engine, voice_config): hardcoded voices, DB voices, then Gemini/Edge."""
     # Determine which engine to use
-    if voice_key in OPENAI_VOICES:
-        voice_config = OPENAI_VOICES[voice_key]
-        engine = "openai"
-    elif voice_key in XAI_VOICES:
-        voice_config = XAI_VOICES[voice_key]
-        engine = "xai"
-    elif voice_key in FISH_VOICES:
-        voice_config = FISH_VOICES[voice_key]
-        engine = "fish"
+    if voice_key in STATIC_VOICE_REGISTRY:
+        engine, voice_config = STATIC_VOICE_REGISTRY[voice_key]
     else:
         # Check if it's a dynamic Fish voice ID
         engine = "edge" # Fallback
@@ -511,10 +626,79 @@ async def generate_tts_chunk(
             voice_config = EDGE_VOICES.get(voice_key, EDGE_VOICES[DEFAULT_VOICE])
             engine = "edge"
 
+    return engine, voice_config
+
+
+async def generate_tts_chunk(
+    text: str,
+    output_path: Path,
+    voice_key: str = DEFAULT_VOICE,
+    rate: str = "0%",
+    is_title: bool = False,
+    genre: str | None = None,
+    previous_text: str | None = None,
+    on_chunk_progress: callable = None,
+    direct_fish_id: str | None = None,
+    multi_voice: bool = False,
+    speaker_voices: dict[str, str] | None = None,
+) -> tuple[Path, str]:
+    """
+    Convert text to speech and save as MP3.
+    Identical requests (text, resolved voice, rate and context) are served from the on-disk TTS cache.
+    """
+    # The key holds the resolved engine and voice config rather than just voice_key, so editing
+    # a system voice (engine, fish_voice_id) or a Gemini quota fallback never replays old audio
+    resolved_voice = await asyncio.to_thread(_resolve_voice, voice_key, direct_fish_id)
+    speaker_ids = None
+    if multi_voice and speaker_voices:
+        speaker_ids = await asyncio.to_thread(
+            lambda: {idx: get_fish_voice_id(key) for idx, key in speaker_voices.items()}
+        )
+    key = _tts_cache_key(
+        text, voice_key, resolved_voice, rate, is_title, genre, previous_text, multi_voice, speaker_voices, speaker_ids
+    )
+    if await asyncio.to_thread(_tts_cache_fetch, key, output_path):
+        logger.info(f"TTS: cache hit for voice {voice_key} -> {output_path}")
+        return output_path, voice_key
+
+    path, realized_voice = await _synthesize_tts_chunk(
+        text, output_path, voice_key, rate, is_title, genre, previous_text,
+        on_chunk_progress, direct_fish_id, multi_voice, speaker_voices, resolved_voice,
+    )
+    # A fallback voice is not what was asked for, so it must not answer future requests
+    if realized_voice == voice_key:
+        try:
+            await asyncio.to_thread(_tts_cache_store, key, path)
+        except Exception as e:
+            logger.warning(f"TTS: failed to store cache entry: {e}")
+    return path, realized_voice
+
+
+async def _synthesize_tts_chunk(
+    text: str,
+    output_path: Path,
+    voice_key: str = DEFAULT_VOICE,
+    rate: str = "0%",
+    is_title: bool = False,
+    genre: str | None = None,
+    previous_text: str | None = None,
+    on_chunk_progress: callable = None,
+    direct_fish_id: str | None = None,
+    multi_voice: bool = False,
+    speaker_voices: dict[str, str] | None = None,
+    resolved_voice: tuple[str, dict] | None = None,
+) -> tuple[Path, str]:
+    """
+    Synthesize text to an MP3 with the engine behind voice_key.
+    Supports Edge TTS, OpenAI, xAI, Fish Audio and Gemini TTS.
+    """
+
+    engine, voice_config = resolved_voice or _resolve_voice(voice_key, direct_fish_id)
+
     logger.info(f"TTS: [Engine: {engine}] Voice: {voice_config.get('id', 'N/A')} (Key: {voice_key}) -> {output_path}")
 
     # Cleanup text: remove markdown formatting
-    clean_text = text.replace("*", "").replace("_", "").replace("#", "")
+    clean_text = text.translate(_MD_STRIP_TABLE)
 
     # Cleanup emotion and speaker tags based on engine support
     if engine not in ["fish", "xai"]:
@@ -529,29 +713,43 @@ async def generate_tts_chunk(
             if edge_rate and not (edge_rate.startswith("+") or edge_rate.startswith("-")):
                 edge_rate = "+" + edge_rate
                 
-            communicate = edge_tts.Communicate(
-                text=clean_text,
-                voice=voice_config["id"],
-                rate=edge_rate,
-            )
-            await communicate.save(str(output_path))
+            segments = split_text_words(clean_text)
+            if len(segments) <= 1:
+                communicate = edge_tts.Communicate(
+                    text=clean_text,
+                    voice=voice_config["id"],
+                    rate=edge_rate,
+                )
+                await communicate.save(str(output_path))
+                return output_path, voice_key
+
+            async def fetch_segment(segment: str) -> bytes:
+                communicate = edge_tts.Communicate(text=segment, voice=voice_config["id"], rate=edge_rate)
+                audio = bytearray()
+                async for message in communicate.stream():
+                    if message["type"] == "audio":
+                        audio += message["data"]
+                return bytes(audio)
+
+            # Edge returns constant-bitrate MP3 frames, so the segments can be joined byte-wise
+            audio_segments = await asyncio.gather(*(fetch_segment(seg) for seg in segments))
+            await asyncio.to_thread(output_path.write_bytes, b"".join(audio_segments))
             return output_path, voice_key
 
         elif engine == "openai":
             if not settings.OPENAI_API_KEY:
                 raise ValueError("OpenAI API Key is missing.")
             
-            import httpx
             from pydub import AudioSegment
             import io
 
-            def split_text_openai(t, max_bytes=2000):
+            def split_text_openai(t, max_chars=OPENAI_TTS_MAX_CHARS):
                 chunks = []
                 current_chunk = ""
                 sentences = t.replace("\n", " ").split(". ")
                 for s in sentences:
                     test_chunk = (current_chunk + ". " + s).strip() if current_chunk else s
-                    if len(test_chunk.encode("utf-8")) > max_bytes:
+                    if len(test_chunk) > max_chars:
                         if current_chunk:
                             chunks.append(current_chunk)
                         current_chunk = s
@@ -569,37 +767,44 @@ async def generate_tts_chunk(
                 "Content-Type": "application/json",
             }
 
-            audio_segments = []
-            async with httpx.AsyncClient(timeout=90.0) as client:
-                for i, chunk in enumerate(text_chunks):
-                    payload = {
-                        "model": "tts-1",
-                        "input": chunk,
-                        "voice": voice_config["id"],
-                        "speed": speed,
-                    }
-                    response = await client.post(
-                        "https://api.openai.com/v1/audio/speech",
-                        headers=headers,
-                        json=payload
-                    )
-                    response.raise_for_status()
-                    audio_segments.append(response.content)
-
-            combined = AudioSegment.empty()
-            for mp3_data in audio_segments:
-                seg = AudioSegment.from_mp3(io.BytesIO(mp3_data))
-                combined += seg
-            combined = combined.set_frame_rate(44100).set_channels(2)
-            await asyncio.to_thread(combined.export, str(output_path), format="mp3", bitrate="192k")
+            client = get_http_client()
+
+            async def fetch_chunk(chunk):
+                payload = {
+                    "model": "tts-1",
+                    "input": chunk,
+                    "voice": voice_config["id"],
+                    "speed": speed,
+                }
+                response = await client.post(
+                    "https://api.openai.com/v1/audio/speech",
+                    headers=headers,
+                    json=payload,
+                    timeout=90.0,
+                )
+                response.raise_for_status()
+                return response.content
+
+            # Chunks are independent requests; gather keeps their order
+            audio_segments = await asyncio.gather(*(fetch_chunk(chunk) for chunk in text_chunks))
+
+            def combine_and_export():
+                combined = AudioSegment.empty()
+                for mp3_data in audio_segments:
+                    combined += AudioSegment.from_mp3(io.BytesIO(mp3_data))
+                combined = combined.set_frame_rate(44100).set_channels(2)
+                combined.export(str(output_path), format="mp3", bitrate="192k")
+
+            # pydub decodes through ffmpeg subprocesses; keep them off the event loop
+            await asyncio.to_thread(combine_and_export)
             return output_path, voice_key
 
         elif engine == "gemini":
-            from google import genai
             from google.genai import types
             import subprocess
+            from app.services.text_generator import get_gemini_client
             
-            client = genai.Client(api_key=settings.GEMINI_API_KEY)
+            client = get_gemini_client()
             text_chunks = split_text_paragraphs(clean_text)
             all_pcm_data = bytearray()
 
@@ -697,7 +902,6 @@ async def generate_tts_chunk(
             if not settings.XAI_API_KEY:
                 raise ValueError("xAI API Key is missing.")
 
-            import httpx
             from pydub import AudioSegment
             import io
 
@@ -724,29 +928,33 @@ async def generate_tts_chunk(
             }
             audio_segments: list[bytes] = []
 
-            async with httpx.AsyncClient(timeout=120.0) as client:
-                for chunk in text_chunks:
-                    payload = {
-                        "text": chunk,
-                        "voice_id": voice_config["id"],
-                        "language": voice_config.get("language", "de"),
-                        "output_format": {
-                            "codec": "mp3"
-                        }
+            client = get_http_client()
+            for chunk in text_chunks:
+                payload = {
+                    "text": chunk,
+                    "voice_id": voice_config["id"],
+                    "language": voice_config.get("language", "de"),
+                    "output_format": {
+                        "codec": "mp3"
                     }
-                    response = await client.post(
-                        "https://api.x.ai/v1/tts",
-                        headers=headers,
-                        json=payload,
-                    )
-                    response.raise_for_status()
-                    audio_segments.append(response.content)
-
-            combined = AudioSegment.empty()
-            for mp3_data in audio_segments:
-                combined += AudioSegment.from_mp3(io.BytesIO(mp3_data))
-            combined = combined.set_frame_rate(44100).set_channels(2)
-            await asyncio.to_thread(combined.export, str(output_path), format="mp3", bitrate="192k")
+                }
+                response = await client.post(
+                    "https://api.x.ai/v1/tts",
+                    headers=headers,
+                    json=payload,
+                )
+                response.raise_for_status()
+                audio_segments.append(response.content)
+
+            def combine_and_export():
+                combined = AudioSegment.empty()
+                for mp3_data in audio_segments:
+                    combined += AudioSegment.from_mp3(io.BytesIO(mp3_data))
+                combined = combined.set_frame_rate(44100).set_channels(2)
+                combined.export(str(output_path), format="mp3", bitrate="192k")
+
+            # Decoding runs ffmpeg as well, not only the export
+            await asyncio.to_thread(combine_and_export)
             return output_path, voice_key
 
         elif engine == "fish":
@@ -868,17 +1076,20 @@ async def generate_tts_chunk(
                     from pydub import AudioSegment
                     import io
 
-                    combined = AudioSegment.empty()
-                    for sub_path in sub_paths:
-                        seg = AudioSegment.from_mp3(str(sub_path))
-                        combined += seg
-                        try:
-                            sub_path.unlink(missing_ok=True)
-                        except Exception:
-                            pass
+                    def combine_and_export():
+                        combined = AudioSegment.empty()
+                        for sub_path in sub_paths:
+                            seg = AudioSegment.from_mp3(str(sub_path))
+                            combined += seg
+                            try:
+                                sub_path.unlink(missing_ok=True)
+                            except Exception:
+                                pass
+
+                        combined = combined.set_frame_rate(44100).set_channels(2)
+                        combined.export(str(output_path), format="mp3", bitrate="192k")
 
-                    combined = combined.set_frame_rate(44100).set_channels(2)
-                    await asyncio.to_thread(combined.export, str(output_path), format="mp3", bitrate="192k")
+                    await asyncio.to_thread(combine_and_export)
             else:
                 # Use S2 Pro for single voice as well to support [bracket] emotion tags
                 logger.info(f"TTS Fish S2-Pro: single-voice enabled. Reference: {voice_config['id']}")
@@ -929,10 +1140,13 @@ async def chapters_to_audio(
     title: str | None = None,
     multi_voice: bool = False,
     speaker_voices: dict[str, str] | None = None,
+    prerendered: dict[int, asyncio.Task] | None = None,
 ) -> tuple[list[Path], str]:
     """
     Convert all chapters to individual MP3 chunks.
     Consolidates text for Gemini TTS to save API calls.
+    prerendered maps chapter indices to generate_tts_chunk tasks that were already started
+    while the text was still being written (non-Gemini voices only).
     """
     is_gemini = voice_key in GEMINI_VOICES
     actual_voice = voice_key
@@ -946,7 +1160,7 @@ async def chapters_to_audio(
             full_story_text += f"{title}. . . \n\n"
         
         full_story_text += "\n\n".join([ch["text"] for ch in chapters])
-        clean_text = full_story_text.replace("*", "").replace("_", "").replace("#", "")
+        clean_text = full_story_text.translate(_MD_STRIP_TABLE)
         
         all_chunks = split_text_paragraphs(clean_text)
         total_all_chunks = len(all_chunks)
@@ -978,8 +1192,8 @@ async def chapters_to_audio(
             if on_progress:
                 await on_progress("tts_chunk_done", f"Chunk {i+1} fertig", {"completed": completed_chunks, "total": total_all_chunks})
 
-        # Throttle to 2 parallel chunks as per user requirement (safe for 10 RPM)
-        semaphore = asyncio.Semaphore(2)
+        # Throttle parallel chunks (default 2, safe for 10 RPM; the rate limiter enforces the RPM itself)
+        semaphore = asyncio.Semaphore(settings.TTS_CONCURRENCY)
         async def run_with_semaphore(idx):
             async with semaphore: await process_gemini_chunk(idx)
 
@@ -1001,8 +1215,8 @@ async def chapters_to_audio(
             msg = f"Vertone Titel und {len(chapters)} Kapitel..." if title else f"Vertone {len(chapters)} Kapitel..."
             await on_progress("tts", msg, {"completed": 0, "total": total_all_chunks})
 
-        # Process title if exists
-        if title:
+        async def process_title():
+            nonlocal actual_voice, completed_chunks
             _, realized_voice = await generate_tts_chunk(
                 f"{title}. . . ", 
                 audio_files[0], 
@@ -1017,30 +1231,41 @@ async def chapters_to_audio(
             if on_progress:
                 await on_progress("tts_chunk_done", "Titel vertont", {"completed": completed_chunks, "total": total_all_chunks})
 
+        prerendered = prerendered or {}
+
         # Process chapters in parallel
         async def process_chapter(chapter_idx: int):
             nonlocal actual_voice, completed_chunks
             # Index in audio_files is (chapter_idx + 1) if title exists
             file_idx = chapter_idx + (1 if title else 0)
-            _, realized_voice = await generate_tts_chunk(
-                chapters[chapter_idx]["text"], 
-                audio_files[file_idx], 
-                voice_key, 
-                rate, 
-                genre=genre,
-                multi_voice=multi_voice,
-                speaker_voices=speaker_voices,
-            )
+            if chapter_idx in prerendered:
+                _, realized_voice = await prerendered[chapter_idx]
+            else:
+                _, realized_voice = await generate_tts_chunk(
+                    chapters[chapter_idx]["text"],
+                    audio_files[file_idx],
+                    voice_key,
+                    rate,
+                    genre=genre,
+                    multi_voice=multi_voice,
+                    speaker_voices=speaker_voices,
+                )
             if realized_voice != voice_key: actual_voice = realized_voice
             completed_chunks += 1
             if on_progress:
                 await on_progress("tts_chunk_done", f"Kapitel {chapter_idx+1} vertont", {"completed": completed_chunks, "total": total_all_chunks})
 
-        # Use a conservative semaphore of 2 for all engines (safe for RPM and stability)
-        semaphore = asyncio.Semaphore(2)
-        async def run_with_semaphore(idx):
-            async with semaphore: await process_chapter(idx)
-
-        # Only process chapters here, title was handled above
-        await asyncio.gather(*[run_with_semaphore(i) for i in range(len(chapters))])
+        # Conservative default of 2 for all engines (safe for RPM and stability)
+        semaphore = asyncio.Semaphore(settings.TTS_CONCURRENCY)
+        async def run_with_semaphore(job):
+            async with semaphore: await job
+
+        # Title shares the pool with the chapters instead of running before them.
+        # Prerendered chapters were throttled by their caller and are only awaited here.
+        jobs = [run_with_semaphore(process_title())] if title else []
+        jobs.extend(
+            process_chapter(i) if i in prerendered else run_with_semaphore(process_chapter(i))
+            for i in range(len(chapters))
+        )
+        await asyncio.gather(*jobs)
         return audio_files, actual_voice
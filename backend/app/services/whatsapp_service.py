@@ -16,7 +16,7 @@ class WhatsAppService:
         if not self.access_token or not self.phone_number_id:
             logger.warning("WhatsApp Cloud API credentials missing (Access Token or Phone Number ID).")
 
-    def send_message(self, to_number: str, body: str, media_url: str = None, buttons: list[str] = None):
+    async def send_message(self, to_number: str, body: str, media_url: str = None, buttons: list[str] = None):
         """Sends a WhatsApp message via Meta Cloud API with optional media or quick-reply buttons."""
         if not self.access_token or not self.phone_number_id:
             logger.error("Cannot send WhatsApp message: Credentials not configured.")
@@ -78,9 +78,9 @@ class WhatsAppService:
             }
             
         try:
-            with httpx.Client() as client:
+            async with httpx.AsyncClient() as client:
                 logger.debug(f"WhatsApp API Request Payload: {json.dumps(payload)}")
-                response = client.post(self.base_url, headers=headers, json=payload)
+                response = await client.post(self.base_url, headers=headers, json=payload)
                 
                 if response.status_code >= 400:
                     logger.error(f"WhatsApp API Error ({response.status_code}): {response.text}")
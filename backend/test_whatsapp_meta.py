@@ -1,3 +1,4 @@
+import asyncio
 import os
 import sys
 from pathlib import Path
@@ -13,7 +14,7 @@ def test_send():
     message = "Test-Nachricht von der neuen WhatsApp Cloud API! 🚀"
     
     print(f"Sending to {to_number}...")
-    result = whatsapp_service.send_message(to_number, message)
+    result = asyncio.run(whatsapp_service.send_message(to_number, message))
     
     if result:
         print(f"Success! Message ID: {result}")